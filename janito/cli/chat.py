@@ -4,10 +4,6 @@ CLI chat execution modes: interactive and single prompt.
 
 import os
 
-from ..system_prompt import SYSTEM_PROMPT, GMAIL_SYSTEM_PROMPT, ONEDRIVE_SYSTEM_PROMPT, get_system_prompt_with_skills
-from ..openai_client import send_prompt
-from ..shell import InteractiveShell
-
 
 def run_interactive_chat(args):
     """Run the interactive chat session.
@@ -15,6 +11,12 @@ def run_interactive_chat(args):
     Args:
         args: Parsed command line arguments
     """
+    # Imported here so that --help and the config commands don't load the
+    # OpenAI client and prompt_toolkit
+    from ..system_prompt import GMAIL_SYSTEM_PROMPT, ONEDRIVE_SYSTEM_PROMPT, get_system_prompt_with_skills
+    from ..openai_client import send_prompt
+    from ..shell import InteractiveShell
+    
     # Set up Gmail mode if requested
     if args.gmail:
         from ..tooling.tools_registry import add_toolset
@@ -52,7 +54,8 @@ def run_interactive_chat(args):
     shell.run(
         send_prompt_func=send_prompt,
         verbose=args.verbose,
-        no_tools=args.no_system_prompt
+        no_tools=args.no_system_prompt,
+        max_history=args.max_history
     )
 
 
@@ -64,6 +67,9 @@ def run_single_prompt(args):
     """
     import sys
     
+    from ..system_prompt import GMAIL_SYSTEM_PROMPT, ONEDRIVE_SYSTEM_PROMPT, get_system_prompt_with_skills
+    from ..openai_client import send_prompt
+    
     # Set up Gmail mode if requested
     if args.gmail:
         from ..tooling.tools_registry import add_toolset
@@ -5,6 +5,17 @@ import argparse
 from .. import __version__
 
 
+def _positive_int(value: str) -> int:
+    """Parse a command-line value as an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the CLI argument parser.
     
@@ -191,6 +202,13 @@ Examples:
         help="Don't persist input history to file (store only in memory)"
     )
     
+    parser.add_argument(
+        "--max-history",
+        type=_positive_int,
+        metavar="N",
+        help="Keep at most N messages of conversation history in interactive chat, dropping the oldest (the system prompt is kept)"
+    )
+    
     parser.add_argument(
         "--gmail",
         action="store_true",
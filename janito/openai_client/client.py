@@ -6,27 +6,47 @@ import os
 import sys
 import json
 import logging
-import threading
+from collections import OrderedDict
 from typing import Tuple, List, Dict, Any, Optional
-from openai import OpenAI
+from openai import OpenAI, BadRequestError
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
+from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Use orjson for tool arguments/results when installed, falling back to json
+try:
+    import orjson
+
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits, which json handles
+            return json.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 # Import tools
 try:
-    from ..tooling.tools_registry import get_all_tool_schemas, get_tool_by_name
+    from ..tooling.tools_registry import AVAILABLE_TOOLS, get_all_tool_schemas, get_tool_by_name
     TOOLS_AVAILABLE = True
 except (ImportError, ValueError):
     try:
         # When running directly, not as a module
-        from tooling.tools_registry import get_all_tool_schemas, get_tool_by_name
+        from tooling.tools_registry import AVAILABLE_TOOLS, get_all_tool_schemas, get_tool_by_name
         TOOLS_AVAILABLE = True
     except ImportError:
         TOOLS_AVAILABLE = False
+        AVAILABLE_TOOLS = {}
         def get_all_tool_schemas():
             return []
         def get_tool_by_name(name):
@@ -62,6 +82,16 @@ except ImportError:
 # Import general configuration handling
 from janito.general_config import load_provider_from_config, load_context_window_size, load_endpoint_from_config
 
+# Shared console for rendering responses, created once per process
+_CONSOLE = Console()
+
+# OpenAI clients keyed by (base_url, api_key), reused so the underlying HTTP
+# connection pool survives across prompts in a chat session
+_CLIENT_CACHE: Dict[Tuple[Optional[str], str], OpenAI] = {}
+
+# Base URLs of backends that rejected a streaming request
+_NON_STREAMING_BACKENDS = set()
+
 
 def get_env_config() -> Tuple[Optional[str], str, str]:
     """
@@ -129,35 +159,193 @@ def get_env_config() -> Tuple[Optional[str], str, str]:
     return base_url, api_key, model
 
 
-def _run_with_progress_bar(func, *args, **kwargs):
-    """Run a function with a Rich progress bar in a separate thread."""
-    result = [None]
-    exception = [None]
-    
-    def target():
-        try:
-            result[0] = func(*args, **kwargs)
-        except Exception as e:
-            exception[0] = e
+def get_client(base_url: Optional[str], api_key: str) -> OpenAI:
+    """
+    Get an OpenAI client for the given endpoint, reusing a cached one if available.
     
-    # Create and start the thread
-    thread = threading.Thread(target=target)
-    thread.start()
+    Args:
+        base_url: The API base URL (None for standard OpenAI)
+        api_key: The API key for authentication
+        
+    Returns:
+        OpenAI: A client bound to the given endpoint and key
+    """
+    key = (base_url, api_key)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = _CLIENT_CACHE[key] = OpenAI(api_key=api_key, base_url=base_url)
+        logger.debug(f"OpenAI client created with base_url={base_url}")
+    return client
+
+
+def _run_with_progress_bar(func, *args, **kwargs):
+    """Run a function while showing a Rich spinner.
     
-    # Show progress bar while waiting
+    The call runs in the current thread; Rich's own refresh thread animates
+    the spinner while the request blocks on network I/O.
+    """
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        transient=True
+        transient=True,
+        refresh_per_second=10
     ) as progress:
-        task = progress.add_task("Waiting for response from the API server...", total=None)
-        while thread.is_alive():
-            progress.update(task, advance=0.1)
-            thread.join(timeout=0.1)
+        progress.add_task("Waiting for response from the API server...", total=None)
+        return func(*args, **kwargs)
+
+
+def _print_response(console: Console, content: str) -> None:
+    """
+    Print an assistant response.
+    
+    On a terminal the response is rendered as Markdown; when output is piped
+    or redirected the raw text is written directly, skipping Rich's Markdown
+    parsing and rendering entirely.
+    """
+    if console.is_terminal:
+        console.print(Markdown(content))
+    else:
+        sys.stdout.write(content if content.endswith("\n") else content + "\n")
+
+
+class _ToolResultCache:
+    """
+    LRU cache of JSON tool results, bounded by the total size of the results.
+    
+    Least recently used results are evicted once the cached text exceeds
+    max_chars, so a prompt that reads many large files doesn't keep them all
+    in memory. A single result larger than the budget is not cached.
+    """
+    
+    def __init__(self, max_chars: int = 16 * 1024 * 1024):
+        self.max_chars = max_chars
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+    
+    def get(self, key: Tuple[str, str]) -> Optional[str]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: Tuple[str, str], value: str) -> None:
+        if len(value) > self.max_chars:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self._entries[key] = value
+        self.size += len(value)
+        while self.size > self.max_chars:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+class _StreamingMarkdown:
+    """Markdown renderable over a growing buffer.
+    
+    The text is only parsed when Live refreshes the display, not on every
+    streamed delta.
+    """
+    
+    def __init__(self):
+        self.parts: List[str] = []
+    
+    def __rich__(self) -> Markdown:
+        return Markdown("".join(self.parts))
+
+
+def _stream_completion(client: OpenAI, console: Console, call_kwargs: Dict[str, Any]) -> Tuple[Optional[str], List[Dict[str, Any]], Any]:
+    """
+    Call the chat completions API with streaming, rendering content as it arrives.
+    
+    Tool calls are reassembled from the streamed deltas, concatenating the
+    partial function arguments of each call.
+    
+    Returns:
+        Tuple of (content, tool_calls, usage); tool_calls are message dicts
+    """
+    stream = _run_with_progress_bar(
+        client.chat.completions.create,
+        stream=True,
+        stream_options={"include_usage": True},
+        **call_kwargs
+    )
     
-    if exception[0]:
-        raise exception[0]
-    return result[0]
+    body = _StreamingMarkdown()
+    tool_calls: Dict[int, Dict[str, Any]] = {}
+    usage = None
+    live = None
+    # Render progressively only on a terminal; otherwise print once at the end
+    render_live = console.is_terminal
+    try:
+        for chunk in stream:
+            if chunk.usage:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                body.parts.append(delta.content)
+                if live is None and render_live:
+                    live = Live(body, console=console, refresh_per_second=10, vertical_overflow="visible")
+                    live.start()
+            for tool_call_delta in delta.tool_calls or ():
+                tool_call = tool_calls.get(tool_call_delta.index)
+                if tool_call is None:
+                    tool_call = tool_calls[tool_call_delta.index] = {
+                        "id": "",
+                        "type": "function",
+                        "function": {"name": "", "arguments": ""},
+                    }
+                if tool_call_delta.id:
+                    tool_call["id"] = tool_call_delta.id
+                function = tool_call_delta.function
+                if function:
+                    if function.name:
+                        tool_call["function"]["name"] += function.name
+                    if function.arguments:
+                        tool_call["function"]["arguments"] += function.arguments
+    finally:
+        if live is not None:
+            live.stop()
+    
+    content = "".join(body.parts) or None
+    if content and not render_live:
+        _print_response(console, content)
+    return content, [tool_calls[index] for index in sorted(tool_calls)], usage
+
+
+def _complete(client: OpenAI, console: Console, base_url: Optional[str], call_kwargs: Dict[str, Any]) -> Tuple[Optional[str], List[Dict[str, Any]], Any]:
+    """
+    Get one assistant turn, streaming when the backend supports it.
+    
+    Backends that reject a streaming request are remembered and served with
+    a regular blocking request from then on.
+    
+    Returns:
+        Tuple of (content, tool_calls, usage); tool_calls are message dicts
+    """
+    if base_url not in _NON_STREAMING_BACKENDS:
+        try:
+            return _stream_completion(client, console, call_kwargs)
+        except BadRequestError as e:
+            logger.debug(f"Streaming request rejected, retrying without streaming: {e}")
+            response = _run_with_progress_bar(client.chat.completions.create, **call_kwargs)
+            _NON_STREAMING_BACKENDS.add(base_url)
+            logger.info(f"Streaming disabled for backend {base_url}")
+    else:
+        response = _run_with_progress_bar(client.chat.completions.create, **call_kwargs)
+    
+    message = response.choices[0].message
+    if message.content:
+        _print_response(console, message.content)
+    tool_calls = [tool_call.model_dump() for tool_call in message.tool_calls or ()]
+    return message.content, tool_calls, response.usage
 
 
 def _is_mcp_tool(tool_name: str) -> bool:
@@ -171,27 +359,48 @@ def _is_mcp_tool(tool_name: str) -> bool:
     return False
 
 
-def send_prompt(prompt: str, verbose: bool = False, previous_messages: List[Dict[str, Any]] = None, tools: Optional[List[Dict[str, Any]]] = None, use_mcp: bool = True) -> str:
+def _trim_history(messages: List[Dict[str, Any]], max_history: int) -> None:
+    """
+    Drop the oldest messages in place so that at most max_history remain.
+    
+    A leading system prompt is always kept, and trimming only stops at a user
+    message so tool results are never separated from the assistant message
+    that requested them. The most recent user message is never dropped.
+    """
+    excess = len(messages) - max_history
+    if excess <= 0:
+        return
+    start = 1 if messages and messages[0].get("role") == "system" else 0
+    end = start + excess
+    while end < len(messages) - 1 and messages[end].get("role") != "user":
+        end += 1
+    del messages[start:end]
+
+
+def send_prompt(prompt: str, verbose: bool = False, previous_messages: List[Dict[str, Any]] = None, tools: Optional[List[Dict[str, Any]]] = None, use_mcp: bool = True, max_history: Optional[int] = None) -> str:
     """Send prompt to OpenAI endpoint and return response.
     
+    The conversation is recorded in previous_messages in place: the user
+    prompt, any tool calls and results, and the final assistant reply are
+    appended to it, after dropping the oldest messages if max_history is
+    set. If the request fails or is interrupted, the list is restored to
+    its original contents, including any messages dropped.
+    
     Args:
         prompt: The user prompt to send
-        verbose: If True, print model and backend info
+        verbose: If True, print model and backend info and token usage
         previous_messages: List of previous message dicts for conversation context
         tools: Optional list of tool schemas to pass. If None, uses all available tools.
                If an empty list, no tools are passed.
         use_mcp: If True, load and use MCP tools (default True)
+        max_history: If set, drop the oldest messages (keeping the system prompt)
+               so that the history stays within this many messages
     """
     logger.info(f"Sending prompt to API")
     base_url, api_key, model = get_env_config()
     
-    # Create OpenAI client - base_url can be None for standard OpenAI
-    client = OpenAI(
-        api_key=api_key,
-        base_url=base_url
-    )
-    
-    logger.debug(f"OpenAI client created with base_url={base_url}")
+    # Get OpenAI client - base_url can be None for standard OpenAI
+    client = get_client(base_url, api_key)
     
     # Initialize MCP manager and load services if enabled
     mcp_manager = None
@@ -222,12 +431,11 @@ def send_prompt(prompt: str, verbose: bool = False, previous_messages: List[Dict
     # Load context window size from general config if set
     context_window_size = load_context_window_size()
     
-    console = Console()
+    console = _CONSOLE
 
     # Print model and backend info only in verbose mode
     if verbose:
         backend = base_url if base_url else "api.openai.com"
-        from rich.text import Text
         text = Text(f"----- Model: {model} | Backend: {backend}")
         text.stylize("white on blue")
         console.print(text, highlight=False)
@@ -238,86 +446,122 @@ def send_prompt(prompt: str, verbose: bool = False, previous_messages: List[Dict
             services_text.stylize("white on green")
             console.print(services_text, highlight=False)
 
-    # Use previous messages if provided, otherwise start with the user prompt
-    messages = previous_messages if previous_messages else []
+    # Record the conversation in the caller's history, or start a new one
+    messages = previous_messages if previous_messages is not None else []
+    # Keep what trimming drops so a failed turn can put it back
+    original_messages = None
+    if max_history is not None:
+        original_messages = messages[:]
+        _trim_history(messages, max_history - 1)
+    history_length = len(messages)
     messages.append({"role": "user", "content": prompt})
     
     logger.debug(f"Starting message loop with {len(messages)} messages")
     
-    while True:
-        # Build the base call parameters
-        call_kwargs = {
-            "model": model,
-            "messages": messages,
-            "temperature": 1.0,
-        }
+    # Bind hot-path lookups as locals for the tool-call loop
+    append = messages.append
+    dumps = _json_dumps
+    tools_by_name = AVAILABLE_TOOLS
+    
+    # JSON results of pure tools for this prompt, keyed by (tool name, canonical args)
+    tool_results_cache = _ToolResultCache()
+    
+    try:
+        while True:
+            # Build the base call parameters
+            call_kwargs = {
+                "model": model,
+                "messages": messages,
+                "temperature": 1.0,
+            }
         
-        # Add max_tokens if context window size is set in config
-        if context_window_size is not None:
-            if model.startswith("gpt-5"):
-                call_kwargs["max_completion_tokens"] = context_window_size
+            # Add max_tokens if context window size is set in config
+            if context_window_size is not None:
+                if model.startswith("gpt-5"):
+                    call_kwargs["max_completion_tokens"] = context_window_size
+                else:
+                    call_kwargs["max_tokens"] = context_window_size
+
+            # Make API call with tools if available
+            if tools_schemas:
+                logger.debug(f"Calling API with {len(tools_schemas)} tools")
+                call_kwargs["tools"] = tools_schemas
+                call_kwargs["tool_choice"] = "auto"
             else:
-                call_kwargs["max_tokens"] = context_window_size
-
-        # Make API call with tools if available
-        if tools_schemas:
-            logger.debug(f"Calling API with {len(tools_schemas)} tools")
-            response = _run_with_progress_bar(
-                client.chat.completions.create,
-                **call_kwargs,
-                tools=tools_schemas,
-                tool_choice="auto"
-            )
-        else:
-            logger.debug("Calling API without tools")
-            response = _run_with_progress_bar(
-                client.chat.completions.create,
-                **call_kwargs
-            )
+                logger.debug("Calling API without tools")
         
-        logger.debug("API response received")
+            content, tool_calls, usage = _complete(client, console, base_url, call_kwargs)
         
-        message = response.choices[0].message
-        if message.content:
-            # print the message using rich markdown
-            console.print(Markdown(message.content))
+            logger.debug("API response received")
         
-        # Check if the model wants to call a function
-        if hasattr(message, 'tool_calls') and message.tool_calls:
-            # Add the model's response to messages
-            messages.append(message)
+            if not tool_calls:
+                # No tool calls, so this is the final response
+                if usage:
+                    total_tokens = usage.total_tokens
+                    # Display token usage only in verbose mode, like the model info
+                    if verbose:
+                        token_text = Text(f"=== Total tokens: {total_tokens} | Messages: {len(messages)} ===")
+                        token_text.stylize("white on magenta")
+                        console.print(token_text, highlight=False)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Request completed: {total_tokens} tokens, {len(messages)} messages")
+                append({"role": "assistant", "content": content})
+                return content if content else ""
             
+            # The model wants to call functions; add its response to messages
+            append({"role": "assistant", "content": content, "tool_calls": tool_calls})
+        
             # Process each tool call
-            for tool_call in message.tool_calls:
-                tool_name = tool_call.function.name
-                tool_args = json.loads(tool_call.function.arguments)
-                
-                logger.info(f"Tool call: {tool_name}({tool_args})")
-                
+            for tool_call in tool_calls:
+                function = tool_call["function"]
+                tool_name = function["name"]
+                tool_args = _json_loads(function["arguments"] or "{}")
+            
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Tool call: {tool_name}({tool_args})")
+            
                 # Check if this is an MCP tool
                 is_mcp = _is_mcp_tool(tool_name)
-                
+            
                 try:
                     if is_mcp and mcp_manager:
-                        # Route to MCP manager
+                        # Route to MCP manager; MCP tools may have side effects
+                        tool_results_cache.clear()
                         logger.debug(f"Routing MCP tool call: {tool_name}")
-                        tool_result = mcp_manager.call_tool(tool_name, tool_args)
+                        tool_content = dumps(mcp_manager.call_tool(tool_name, tool_args))
                         logger.info(f"MCP tool {tool_name} completed successfully")
                     else:
                         # Route to built-in tool
-                        tool_function = get_tool_by_name(tool_name)
-                        logger.debug(f"Executing built-in tool: {tool_name}")
-                        tool_result = tool_function(**tool_args)
-                        logger.info(f"Tool {tool_name} completed successfully")
+                        tool_function = tools_by_name.get(tool_name)
+                        if tool_function is None:
+                            # Raises a KeyError listing the available tools
+                            tool_function = get_tool_by_name(tool_name)
+                        if getattr(tool_function, '_tool_pure', False):
+                            cache_key = (tool_name, json.dumps(tool_args, sort_keys=True))
+                            tool_content = tool_results_cache.get(cache_key)
+                        else:
+                            # Side effects may invalidate earlier pure results
+                            cache_key = None
+                            tool_content = None
+                            tool_results_cache.clear()
                     
+                        if tool_content is not None:
+                            logger.info(f"Tool {tool_name} result reused from an identical earlier call")
+                        else:
+                            logger.debug(f"Executing built-in tool: {tool_name}")
+                            tool_content = dumps(tool_function(**tool_args))
+                            logger.info(f"Tool {tool_name} completed successfully")
+                            if cache_key is not None:
+                                tool_results_cache.put(cache_key, tool_content)
+                
                     # Add the tool response to messages
-                    messages.append({
-                        "tool_call_id": tool_call.id,
+                    append({
+                        "tool_call_id": tool_call["id"],
                         "role": "tool",
                         "name": tool_name,
-                        "content": json.dumps(tool_result)
+                        "content": tool_content
                     })
-                    
+                
                 except Exception as e:
                     logger.error(f"Tool {tool_name} failed: {e}")
                     # Handle tool execution errors
@@ -325,25 +569,17 @@ def send_prompt(prompt: str, verbose: bool = False, previous_messages: List[Dict
                         "success": False,
                         "error": f"Tool execution failed: {str(e)}"
                     }
-                    messages.append({
-                        "tool_call_id": tool_call.id,
+                    append({
+                        "tool_call_id": tool_call["id"],
                         "role": "tool",
                         "name": tool_name,
-                        "content": json.dumps(error_result)
+                        "content": dumps(error_result)
                     })
                     print(f"\u274c Tool error: {tool_name} - {e}", file=sys.stderr)
-            
-            # Continue the loop to get the final response after tool calls
-            continue
+    except BaseException:
+        # Leave the history as it was so a failed turn can simply be retried
+        if original_messages is not None:
+            messages[:] = original_messages
         else:
-            # No more tool calls, return the final response
-            # Display token usage with cyan background
-            if hasattr(response, 'usage') and response.usage:
-                total_tokens = response.usage.total_tokens
-                from rich.text import Text
-                token_text = Text(f"=== Total tokens: {total_tokens} | Messages: {len(messages)} ===")
-                token_text.stylize("white on magenta")
-                console.print(token_text, highlight=False)
-                logger.info(f"Request completed: {total_tokens} tokens, {len(messages)} messages")
-            return message.content if message.content else ""
-            
+            del messages[history_length:]
+        raise
@@ -174,7 +174,8 @@ class InteractiveShell:
         self,
         send_prompt_func: Callable,
         verbose: bool = False,
-        no_tools: bool = False
+        no_tools: bool = False,
+        max_history: Optional[int] = None
     ) -> None:
         """
         Run the interactive chat loop.
@@ -183,6 +184,7 @@ class InteractiveShell:
             send_prompt_func: Function to call to send prompts to the AI
             verbose: Enable verbose output
             no_tools: If True, don't pass any tools to the AI
+            max_history: If set, the most messages of history to send with each prompt
         """
         import sys
         import subprocess
@@ -269,20 +271,16 @@ class InteractiveShell:
             if user_input.strip():
                 tools_to_use = [] if no_tools else None
                 try:
-                    response = send_prompt_func(
+                    # send_prompt_func records the exchange in messages_history
+                    send_prompt_func(
                         user_input,
                         verbose=verbose,
                         previous_messages=self.messages_history,
-                        tools=tools_to_use
+                        tools=tools_to_use,
+                        max_history=max_history
                     )
                 except KeyboardInterrupt:
+                    # send_prompt leaves the history untouched on interruption
                     print("Request interrupted")
-                    response = None
-                    user_input = None
-                # Add the user message and AI response to history
-                if user_input:
-                    self.messages_history.append({"role": "user", "content": user_input})
-                if response:
-                    self.messages_history.append({"role": "assistant", "content": response})
         
         print("\nChat session ended.")
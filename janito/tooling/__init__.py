@@ -9,7 +9,7 @@ This package provides infrastructure for AI tools including:
 """
 
 from .base_tool import BaseTool
-from .path_utils import norm_path
+from .path_utils import norm_path, to_abs_path
 from .reporter import (
     report_start,
     report_progress,
@@ -25,6 +25,7 @@ from .reporter import (
 __all__ = [
     "BaseTool",
     "norm_path",
+    "to_abs_path",
     "report_start",
     "report_progress",
     "report_result",
@@ -6,10 +6,43 @@ This module provides a base class that tools can inherit from to get automatic
 progress reporting capabilities and permission awareness.
 """
 
-import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional
 
+from .reporter import _ReportColors, _ERRORS_ENABLED, _REPORT_ENABLED, _write_stderr
+
+
+_RESULT_PREFIX = f"{_ReportColors.WHITE} ✅ "
+
+# Colors keyed by the most privileged permission a tool declares
+_START_COLORS = {
+    "": _ReportColors.CYAN,     # Cyan for no permissions (default)
+    "x": _ReportColors.YELLOW,  # Yellow for execute
+    "w": _ReportColors.YELLOW,  # Yellow for write (same as execute)
+    "r": _ReportColors.GREEN,   # Green for read-only (safe)
+}
+
+
+def _permission_bucket(permissions: str) -> str:
+    """Get the most privileged of "x", "w" and "r" in a permissions string, or ""."""
+    return "x" if "x" in permissions else "w" if "w" in permissions else "r" if "r" in permissions else ""
+
+
+@lru_cache(maxsize=16)
+def _get_start_prefix(permissions: str) -> str:
+    """
+    Get the colored prefix for start messages of tools with the given permissions.
+    
+    Args:
+        permissions (str): The tool's permissions string (e.g. "rw")
+        
+    Returns:
+        str: The prefix, including the leading space and ANSI color code
+    """
+    # we put a space before the message to differentiate tool msgs from llm msgs
+    return f" {_START_COLORS[_permission_bucket(permissions)]}"
 
 
 class BaseTool(ABC):
@@ -21,13 +54,33 @@ class BaseTool(ABC):
     aware of the tool's declared permissions.
     """
     
-    # Class-level permissions attribute (set by the @tool decorator)
+    # Class-level permissions and purity attributes (set by the @tool decorator)
     _tool_permissions: str = ""
+    _tool_pure: bool = False
+    # Report prefix for the permissions (also set by the @tool decorator)
+    _tool_start_prefix: str = _get_start_prefix("")
+    # Messages collected by report_batch, or None when writing directly
+    _report_buffer: Optional[List[str]] = None
     
     def __init__(self):
         """Initialize the base tool."""
         pass
     
+    @classmethod
+    def get_instance(cls) -> "BaseTool":
+        """
+        Get the shared instance of this tool class, creating it on first use.
+        
+        Only meant for tools that keep no per-call state on the instance.
+        
+        Returns:
+            BaseTool: The instance shared by all callers
+        """
+        instance = cls.__dict__.get("_singleton")
+        if instance is None:
+            instance = cls._singleton = cls()
+        return instance
+    
     @abstractmethod
     def run(self, **kwargs) -> Dict[str, Any]:
         """
@@ -43,6 +96,36 @@ class BaseTool(ABC):
         """
         pass
     
+    @contextmanager
+    def report_batch(self) -> Iterator[None]:
+        """
+        Collect the messages reported inside the block and write them at once.
+        
+        Meant for quick operations whose messages would otherwise go out as
+        several writes within moments of each other; slow tools should report
+        directly so progress stays visible. The collected messages are written
+        when the block exits, including when it raises.
+        """
+        if self._report_buffer is not None:
+            # Already batching; the outer block writes everything
+            yield
+            return
+        buffer = self._report_buffer = []
+        try:
+            yield
+        finally:
+            self._report_buffer = None
+            if buffer:
+                _write_stderr("".join(buffer))
+    
+    def _write(self, text: str) -> None:
+        """Write a report message, or collect it while inside report_batch."""
+        buffer = self._report_buffer
+        if buffer is None:
+            _write_stderr(text)
+        else:
+            buffer.append(text)
+    
     def report_start(self, message: str, end: str = "\n") -> None:
         """
         Report that the tool operation is starting.
@@ -51,23 +134,10 @@ class BaseTool(ABC):
             message (str): The message to display
             end (str): String appended after the message (default: "\n")
         """
-        # Get permission-based color for start messages only
-        permissions = getattr(self, '_tool_permissions', "")
-        if not permissions:
-            color = "\033[36m"  # Cyan for no permissions (default)
-        elif "x" in permissions:
-            color = "\033[33m"  # Yellow for execute
-        elif "w" in permissions:
-            color = "\033[33m"  # Yellow for write (same as execute)
-        elif "r" in permissions:
-            color = "\033[32m"  # Green for read-only (safe)
-        else:
-            color = "\033[36m"  # Cyan as fallback
-        
-        reset_color = "\033[0m"
-        # we put a space before the message to differentiate tool msgs from llm msgs
-        colored_message = f" {color}{message}{reset_color}"
-        print(colored_message, file=sys.stderr, end=end, flush=True)
+        if not _REPORT_ENABLED:
+            return
+        # Permission-based color for start messages only
+        self._write(f"{self._tool_start_prefix}{message}{_ReportColors.RESET}{end}")
     
     def report_progress(self, message: str, end: str = "\n") -> None:
         """
@@ -77,7 +147,9 @@ class BaseTool(ABC):
             message (str): The progress message to display
             end (str): String appended after the message (default: "\n")
         """
-        print(f"{message}", file=sys.stderr, end=end, flush=True)
+        if not _REPORT_ENABLED:
+            return
+        self._write(f"{message}{end}")
     
     def report_result(self, message: str, end: str = "\n") -> None:
         """
@@ -87,10 +159,9 @@ class BaseTool(ABC):
             message (str): The result message to display
             end (str): String appended after the message (default: "\n")
         """
-        white_color = "\033[37m"
-        reset_color = "\033[0m"
-        colored_message = f"{white_color} ✅ {message}{reset_color}"
-        print(colored_message, file=sys.stderr, end=end, flush=True)
+        if not _REPORT_ENABLED:
+            return
+        self._write(f"{_RESULT_PREFIX}{message}{_ReportColors.RESET}{end}")
     
     def report_error(self, message: str, end: str = "\n") -> None:
         """
@@ -100,7 +171,9 @@ class BaseTool(ABC):
             message (str): The error message to display
             end (str): String appended after the message (default: "\n")
         """
-        print(f"❌ {message}", file=sys.stderr, end=end, flush=True)
+        if not _ERRORS_ENABLED:
+            return
+        self._write(f"❌ {message}{end}")
     
     def report_warning(self, message: str, end: str = "\n") -> None:
         """
@@ -110,41 +183,34 @@ class BaseTool(ABC):
             message (str): The warning message to display
             end (str): String appended after the message (default: "\n")
         """
-        print(f"⚠️{message}", file=sys.stderr, end=end, flush=True)
+        if not _REPORT_ENABLED:
+            return
+        self._write(f"⚠️{message}{end}")
     
-    def _get_permission_color(self) -> str:
+    def _error_result(self, label: str, exc: BaseException, **context: Any) -> Dict[str, Any]:
         """
-        Get ANSI color code based on tool permissions.
+        Report an exception and build the matching failed result.
         
+        Args:
+            label (str): What failed, e.g. "Permission denied"
+            exc (BaseException): The exception that was raised
+            **context: Extra fields for the result (typically the tool arguments)
+            
         Returns:
-            str: ANSI color escape sequence
-        """
-        permissions = getattr(self, '_tool_permissions', "")
-        if not permissions:
-            return "\033[36m"  # Cyan for no permissions (default)
-        elif "x" in permissions:
-            return "\033[31m"  # Red for execute (dangerous)
-        elif "w" in permissions:
-            return "\033[33m"  # Orange for write
-        elif "r" in permissions:
-            return "\033[32m"  # Green for read-only (safe)
-        else:
-            return "\033[36m"  # Cyan as fallback
+            Dict[str, Any]: {"success": False, "error": "<label>: <exc>", **context}
+        """
+        return self._failure_result(f"{label}: {exc}", **context)
     
-    def _report_with_permissions(self, message: str, end: str, report_type: str) -> None:
+    def _failure_result(self, error: str, **context: Any) -> Dict[str, Any]:
         """
-        Internal method to report messages with permission-based coloring.
+        Report an error and build the matching failed result.
         
         Args:
-            message (str): The message to display
-            end (str): String appended after the message
-            report_type (str): Type of report ("start", "progress", "result")
-        """
-        color = self._get_permission_color()
-        reset_color = "\033[0m"
-        if report_type == "result":
-            white_color = "\033[37m"
-            colored_message = f"{white_color}{message}{reset_color}"
-        else:
-            colored_message = f"{color}{message}{reset_color}"
-        print(colored_message, file=sys.stderr, end=end, flush=True)
\ No newline at end of file
+            error (str): The error message
+            **context: Extra fields for the result (typically the tool arguments)
+            
+        Returns:
+            Dict[str, Any]: {"success": False, "error": error, **context}
+        """
+        self.report_error(error)
+        return {"success": False, "error": error, **context}
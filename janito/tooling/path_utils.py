@@ -3,7 +3,23 @@ Path utility functions for normalizing paths relative to the current working dir
 """
 
 import os
-from pathlib import Path
+from functools import lru_cache
+
+
+def to_abs_path(path):
+    """
+    Return an absolute version of path.
+    
+    Absolute paths are returned as-is, skipping the getcwd() and normalization
+    done by os.path.abspath; relative paths are resolved with os.path.abspath.
+    
+    Args:
+        path (str): The path to make absolute.
+        
+    Returns:
+        str: The absolute path.
+    """
+    return path if os.path.isabs(path) else os.path.abspath(path)
 
 
 def norm_path(path):
@@ -14,33 +30,41 @@ def norm_path(path):
     - If the path is a subpath of the working directory, return './relative_path'.
     - Otherwise, return the original path unchanged.
     
+    Results are cached per path and working directory.
+    
     Args:
         path (str or Path): The path to normalize.
         
     Returns:
         str: The normalized path.
     """
-    # Convert to Path object if it's a string
-    if isinstance(path, str):
-        path_obj = Path(path)
-    else:
-        path_obj = path
+    return _norm_path_cached(os.fspath(path), os.getcwd())
+
+
+@lru_cache(maxsize=4096)
+def _norm_path_cached(path_str, cwd_str):
+    """
+    Normalize path_str relative to cwd_str; see norm_path.
     
-    # Get absolute paths
-    abs_path = path_obj.resolve()
-    cwd = Path.cwd().resolve()
+    Args:
+        path_str (str): The path to normalize.
+        cwd_str (str): The current working directory.
+        
+    Returns:
+        str: The normalized path.
+    """
+    # Plain string operations; unlike Path.resolve() these don't touch the filesystem
+    abs_path = os.path.abspath(os.path.join(cwd_str, path_str))
     
     # If the path matches exactly the current working directory
-    if abs_path == cwd:
-        return str(abs_path)
+    if abs_path == cwd_str:
+        return abs_path
     
     # If the path is a subpath of the working directory
-    try:
-        # Try to get the relative path
-        rel_path = abs_path.relative_to(cwd)
-        # If we get here, it's a subpath
+    prefix = cwd_str if cwd_str.endswith(os.sep) else cwd_str + os.sep
+    if abs_path.startswith(prefix):
         # Convert to POSIX style (forward slashes) for consistent output
-        return f"./{rel_path.as_posix()}"
-    except ValueError:
-        # If relative_to raises ValueError, it's not a subpath
-        return str(path_obj)
\ No newline at end of file
+        return "./" + abs_path[len(prefix):].replace(os.sep, "/")
+    
+    # Not a subpath, return the original path unchanged
+    return path_str
@@ -6,10 +6,50 @@ This module provides progress reporting functions that can be used
 by any code that needs to report progress to the user, including MCP tools.
 """
 
+import io
+import os
 import sys
 from typing import Optional
 
 
+def _stderr_discarded() -> bool:
+    """
+    Check whether stderr output would be thrown away.
+    
+    Returns:
+        bool: True if there is no stderr or it is redirected to the null device
+    """
+    if sys.stderr is None:
+        return True
+    try:
+        st = os.fstat(sys.stderr.fileno())
+        null_st = os.stat(os.devnull)
+    except (AttributeError, ValueError, OSError, io.UnsupportedOperation):
+        return False
+    return (st.st_dev, st.st_ino) == (null_st.st_dev, null_st.st_ino)
+
+
+# Nothing is reported when stderr goes to the null device; progress reports
+# (everything but errors) are also skipped when JANITO_QUIET=1
+_ERRORS_ENABLED = not _stderr_discarded()
+_REPORT_ENABLED = _ERRORS_ENABLED and os.getenv("JANITO_QUIET") != "1"
+
+
+def _stderr_supports_color() -> bool:
+    """
+    Check whether progress output should be colored.
+    
+    Returns:
+        bool: True if stderr is a terminal and NO_COLOR is not set
+    """
+    if os.getenv("NO_COLOR"):
+        return False
+    try:
+        return sys.stderr.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
 # ANSI color codes
 class Colors:
     CYAN = "\033[36m"
@@ -20,6 +60,70 @@ class Colors:
     RESET = "\033[0m"
 
 
+class _PlainColors:
+    """Empty stand-ins for the Colors codes."""
+    CYAN = GREEN = YELLOW = RED = WHITE = RESET = ""
+
+
+# The codes used in reports. Without a terminal (output redirected to a file
+# or captured) they are empty, so reports are written as plain text
+_ReportColors = Colors if _stderr_supports_color() else _PlainColors
+
+
+# Flush policies for the current stderr stream
+_FLUSH_NEVER = 0
+_FLUSH_PARTIAL_LINES = 1
+_FLUSH_ALWAYS = 2
+
+# (stream, write, flush, flush policy) for the last seen sys.stderr
+_stderr_binding = (None, None, None, _FLUSH_ALWAYS)
+
+
+def _bind_stderr(stream) -> tuple:
+    """
+    Cache the bound write/flush methods and flush policy of a stderr stream.
+    
+    The default stderr writes straight through to an unbuffered file and never
+    needs flushing; a line-buffered stream flushes complete lines itself, so
+    only partial lines (progress messages written with end="") need a flush.
+    
+    Args:
+        stream: The stream sys.stderr currently refers to
+        
+    Returns:
+        tuple: (stream, write, flush, flush policy)
+    """
+    global _stderr_binding
+    if getattr(stream, "write_through", False) and isinstance(getattr(stream, "buffer", None), io.RawIOBase):
+        policy = _FLUSH_NEVER
+    elif getattr(stream, "line_buffering", False):
+        policy = _FLUSH_PARTIAL_LINES
+    else:
+        policy = _FLUSH_ALWAYS
+    _stderr_binding = (stream, stream.write, stream.flush, policy)
+    return _stderr_binding
+
+
+def _write_stderr(text: str) -> None:
+    """
+    Write text to stderr with a single write call, flushing only when needed.
+    
+    sys.stderr is looked up on each call so redirections stay effective; its
+    bound methods are cached until it is replaced.
+    
+    Args:
+        text: The text to write, including any line ending
+    """
+    stream = sys.stderr
+    binding = _stderr_binding
+    if binding[0] is not stream:
+        binding = _bind_stderr(stream)
+    _, write, flush, policy = binding
+    write(text)
+    if policy == _FLUSH_ALWAYS or (policy == _FLUSH_PARTIAL_LINES and not text.endswith("\n")):
+        flush()
+
+
 def report_start(message: str, end: str = "\n", color: str = Colors.CYAN) -> None:
     """
     Report that an operation is starting.
@@ -29,8 +133,11 @@ def report_start(message: str, end: str = "\n", color: str = Colors.CYAN) -> Non
         end: String appended after the message (default: "\n")
         color: The color to use (default: CYAN)
     """
-    colored_message = f" {color}🔄 {message}{Colors.RESET}"
-    print(colored_message, file=sys.stderr, end=end, flush=True)
+    if not _REPORT_ENABLED:
+        return
+    if _ReportColors is _PlainColors:
+        color = ""
+    _write_stderr(f" {color}🔄 {message}{_ReportColors.RESET}{end}")
 
 
 def report_progress(message: str, end: str = "\n") -> None:
@@ -41,7 +148,9 @@ def report_progress(message: str, end: str = "\n") -> None:
         message: The progress message to display
         end: String appended after the message (default: "\n")
     """
-    print(f"{message}", file=sys.stderr, end=end, flush=True)
+    if not _REPORT_ENABLED:
+        return
+    _write_stderr(f"{message}{end}")
 
 
 def report_result(message: str, end: str = "\n") -> None:
@@ -52,8 +161,9 @@ def report_result(message: str, end: str = "\n") -> None:
         message: The result message to display
         end: String appended after the message (default: "\n")
     """
-    colored_message = f"{Colors.WHITE} ✅ {message}{Colors.RESET}"
-    print(colored_message, file=sys.stderr, end=end, flush=True)
+    if not _REPORT_ENABLED:
+        return
+    _write_stderr(f"{_ReportColors.WHITE} ✅ {message}{_ReportColors.RESET}{end}")
 
 
 def report_error(message: str, end: str = "\n") -> None:
@@ -64,7 +174,9 @@ def report_error(message: str, end: str = "\n") -> None:
         message: The error message to display
         end: String appended after the message (default: "\n")
     """
-    print(f"❌ {message}", file=sys.stderr, end=end, flush=True)
+    if not _ERRORS_ENABLED:
+        return
+    _write_stderr(f"❌ {message}{end}")
 
 
 def report_warning(message: str, end: str = "\n") -> None:
@@ -75,7 +187,9 @@ def report_warning(message: str, end: str = "\n") -> None:
         message: The warning message to display
         end: String appended after the message (default: "\n")
     """
-    print(f"⚠️  {message}", file=sys.stderr, end=end, flush=True)
+    if not _REPORT_ENABLED:
+        return
+    _write_stderr(f"⚠️  {message}{end}")
 
 
 def report_info(message: str, end: str = "\n") -> None:
@@ -86,4 +200,6 @@ def report_info(message: str, end: str = "\n") -> None:
         message: The info message to display
         end: String appended after the message (default: "\n")
     """
-    print(f"{Colors.CYAN}ℹ️  {message}{Colors.RESET}", file=sys.stderr, end=end, flush=True)
+    if not _REPORT_ENABLED:
+        return
+    _write_stderr(f"{_ReportColors.CYAN}ℹ️  {message}{_ReportColors.RESET}{end}")
@@ -4,8 +4,8 @@ Main tools module for AI function calling.
 This module provides easy access to all available tools and their schemas.
 """
 
-from typing import Dict, Any, List, Callable, Optional, get_type_hints, Union
-from ..tools import discover_toolsets
+from typing import Dict, Any, List, Callable, Optional, Union
+from ..tools import discover_toolsets, resolve_type_hints
 from .skills_provider import (
     get_skills_provider,
     load_skill,
@@ -13,6 +13,7 @@ from .skills_provider import (
     get_skills_advertisement,
     get_skills_tools,
 )
+from functools import lru_cache
 import inspect
 import re
 
@@ -26,11 +27,22 @@ _loaded_toolsets = set(AUTOLOAD_TOOLSETS.copy())
 # Flag to enable skills support
 _skills_enabled = True
 
+# Docstring patterns used to extract parameter descriptions
+_ARGS_RE = re.compile(r'Args:\s*(.*?)(?:\n\s*\w+:|\Z)', re.DOTALL | re.IGNORECASE)
+_PARAM_RE = re.compile(r'(\w+)\s*(?:\([^)]*\))?:\s*(.*?)(?=\n\s*\w+\s*(?:\([^)]*\))?:|\Z)', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
 
+# JSON schema types for annotated parameter types; anything else is a string
+_JSON_TYPES = {int: "integer", float: "number", bool: "boolean"}
+
+
+@lru_cache(maxsize=None)
 def get_function_schema(func: Callable) -> Dict[str, Any]:
     """
     Generate a JSON schema for a function based on its signature and docstring.
     
+    Schemas are cached per function; callers must not modify the result.
+    
     Args:
         func (Callable): The function to generate a schema for
         
@@ -50,20 +62,19 @@ def get_function_schema(func: Callable) -> Dict[str, Any]:
     param_descriptions = {}
     if docstring:
         # Look for Args section in docstring
-        args_match = re.search(r'Args:\s*(.*?)(?:\n\s*\w+:|\Z)', docstring, re.DOTALL | re.IGNORECASE)
+        args_match = _ARGS_RE.search(docstring)
         if args_match:
             args_section = args_match.group(1)
             # Match parameter descriptions like "param_name (type): description"
-            param_pattern = r'(\w+)\s*(?:\([^)]*\))?:\s*(.*?)(?=\n\s*\w+\s*(?:\([^)]*\))?:|\Z)'
-            matches = re.findall(param_pattern, args_section, re.DOTALL)
+            matches = _PARAM_RE.findall(args_section)
             for param_name, desc in matches:
                 # Clean up the description
-                clean_desc = re.sub(r'\s+', ' ', desc.strip())
+                clean_desc = _WHITESPACE_RE.sub(' ', desc.strip())
                 param_descriptions[param_name] = clean_desc
     
     # Get function signature
     sig = inspect.signature(func)
-    type_hints = get_type_hints(func)
+    type_hints = resolve_type_hints(func)
     
     # Build parameters schema
     properties = {}
@@ -95,24 +106,9 @@ def get_function_schema(func: Callable) -> Dict[str, Any]:
             if hint == List or origin is list:
                 is_array = True
                 if args:
-                    item_hint = args[0]
-                    if item_hint == int:
-                        items_type = "integer"
-                    elif item_hint == float:
-                        items_type = "number"
-                    elif item_hint == bool:
-                        items_type = "boolean"
-                    else:
-                        items_type = "string"
-                else:
-                    items_type = "string"
-            elif hint == int:
-                param_type = "integer"
-            elif hint == float:
-                param_type = "number"
-            elif hint == bool:
-                param_type = "boolean"
-            # For other types, keep as string
+                    items_type = _JSON_TYPES.get(args[0], "string")
+            else:
+                param_type = _JSON_TYPES.get(hint, "string")
         
         # Build property schema
         if is_array:
@@ -150,9 +146,47 @@ def get_function_schema(func: Callable) -> Dict[str, Any]:
 # Dynamically discover and load tools from configured toolsets
 AVAILABLE_TOOLS = discover_toolsets(AUTOLOAD_TOOLSETS)
 
+# Schemas and permissions of AVAILABLE_TOOLS, kept in sync by _register_tools
+# and _unregister_tool
+_SCHEMAS_BY_NAME: Dict[str, Dict[str, Any]] = {}
+_PERMS_BY_NAME: Dict[str, str] = {}
+
+
+def _register_tools(tools: Dict[str, Callable]) -> None:
+    """
+    Add tools to AVAILABLE_TOOLS and index their schemas and permissions.
+    
+    Args:
+        tools (Dict[str, Callable]): Dictionary of tool names to functions
+    """
+    AVAILABLE_TOOLS.update(tools)
+    for name, tool in tools.items():
+        _SCHEMAS_BY_NAME[name] = get_function_schema(tool)
+        _PERMS_BY_NAME[name] = getattr(tool, '_tool_permissions', "")
+
+
+def _unregister_tool(name: str) -> None:
+    """
+    Remove a tool from AVAILABLE_TOOLS and its indexes, if present.
+    
+    Args:
+        name (str): Name of the tool
+    """
+    AVAILABLE_TOOLS.pop(name, None)
+    _SCHEMAS_BY_NAME.pop(name, None)
+    _PERMS_BY_NAME.pop(name, None)
+
+
+def _tool_not_found(name: str) -> KeyError:
+    """Build the KeyError raised for an unknown tool name."""
+    return KeyError(f"Tool '{name}' not found. Available tools: {list(AVAILABLE_TOOLS.keys())}")
+
+
+_register_tools(dict(AVAILABLE_TOOLS))
+
 # Add skill tools if enabled
 if _skills_enabled:
-    AVAILABLE_TOOLS.update(get_skills_tools())
+    _register_tools(get_skills_tools())
 
 
 def add_toolset(toolset_name: str) -> bool:
@@ -176,7 +210,7 @@ def add_toolset(toolset_name: str) -> bool:
     new_tools = discover_toolsets([toolset_name])
     
     if new_tools:
-        AVAILABLE_TOOLS.update(new_tools)
+        _register_tools(new_tools)
         return True
     
     return False
@@ -196,10 +230,12 @@ def get_all_tool_schemas() -> List[Dict[str, Any]]:
     """
     Get all tool schemas in the format expected by OpenAI function calling.
     
+    Schemas are generated once, when a tool is registered.
+    
     Returns:
         List[Dict[str, Any]]: List of tool schemas
     """
-    return [get_function_schema(tool) for tool in AVAILABLE_TOOLS.values()]
+    return list(_SCHEMAS_BY_NAME.values())
 
 
 def get_all_tool_permissions() -> Dict[str, str]:
@@ -209,7 +245,7 @@ def get_all_tool_permissions() -> Dict[str, str]:
     Returns:
         Dict[str, str]: Dictionary mapping tool names to their permission strings
     """
-    return {name: getattr(tool, '_tool_permissions', "") for name, tool in AVAILABLE_TOOLS.items()}
+    return _PERMS_BY_NAME.copy()
 
 
 def get_tool_by_name(name: str) -> Callable:
@@ -225,9 +261,10 @@ def get_tool_by_name(name: str) -> Callable:
     Raises:
         KeyError: If tool with given name doesn't exist
     """
-    if name not in AVAILABLE_TOOLS:
-        raise KeyError(f"Tool '{name}' not found. Available tools: {list(AVAILABLE_TOOLS.keys())}")
-    return AVAILABLE_TOOLS[name]
+    try:
+        return AVAILABLE_TOOLS[name]
+    except KeyError:
+        raise _tool_not_found(name) from None
 
 
 def get_tool_schema_by_name(name: str) -> Dict[str, Any]:
@@ -243,9 +280,10 @@ def get_tool_schema_by_name(name: str) -> Dict[str, Any]:
     Raises:
         KeyError: If tool with given name doesn't exist
     """
-    if name not in AVAILABLE_TOOLS:
-        raise KeyError(f"Tool '{name}' not found. Available tools: {list(AVAILABLE_TOOLS.keys())}")
-    return get_function_schema(AVAILABLE_TOOLS[name])
+    try:
+        return _SCHEMAS_BY_NAME[name]
+    except KeyError:
+        raise _tool_not_found(name) from None
 
 
 def get_tool_permissions(name: str) -> str:
@@ -261,9 +299,10 @@ def get_tool_permissions(name: str) -> str:
     Raises:
         KeyError: If tool with given name doesn't exist
     """
-    if name not in AVAILABLE_TOOLS:
-        raise KeyError(f"Tool '{name}' not found. Available tools: {list(AVAILABLE_TOOLS.keys())}")
-    return getattr(AVAILABLE_TOOLS[name], '_tool_permissions', "")
+    try:
+        return _PERMS_BY_NAME[name]
+    except KeyError:
+        raise _tool_not_found(name) from None
 
 
 def get_skills_section() -> str:
@@ -298,7 +337,7 @@ def enable_skills() -> None:
     """Enable skills support."""
     global _skills_enabled
     _skills_enabled = True
-    AVAILABLE_TOOLS.update(get_skills_tools())
+    _register_tools(get_skills_tools())
 
 
 def disable_skills() -> None:
@@ -306,7 +345,7 @@ def disable_skills() -> None:
     global _skills_enabled, AVAILABLE_TOOLS
     _skills_enabled = False
     for tool_name in ["load_skill", "read_skill_resource"]:
-        AVAILABLE_TOOLS.pop(tool_name, None)
+        _unregister_tool(tool_name)
 
 
 if __name__ == "__main__":
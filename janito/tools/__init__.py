@@ -8,10 +8,123 @@ dynamically based on the AUTOLOAD_TOOLSETS configuration.
 import os
 import importlib
 import inspect
-from typing import Dict, Callable, List, get_type_hints
+import pkgutil
+from typing import Any, Dict, Callable, List, Optional, get_type_hints
 
 
 from .decorator import is_tool
+from ..tooling.base_tool import BaseTool
+
+
+def resolve_type_hints(func: Callable) -> Dict[str, Any]:
+    """
+    Get the type hints of a function, evaluating string annotations only if needed.
+    
+    When no annotation is a string (forward reference or PEP 563), the
+    function's __annotations__ already hold the types and are returned as a
+    copy; otherwise this falls back to typing.get_type_hints.
+    
+    Args:
+        func: The function to inspect
+        
+    Returns:
+        Dict[str, Any]: Mapping of parameter names (and 'return') to types
+    """
+    annotations = getattr(func, '__annotations__', None)
+    if isinstance(annotations, dict) and not any(isinstance(hint, str) for hint in annotations.values()):
+        return dict(annotations)
+    return get_type_hints(func)
+
+
+def _compile_wrapper(params: List[inspect.Parameter], target: str, namespace: Dict[str, Any]) -> Optional[Callable]:
+    """
+    Generate a function with the given parameters that forwards them by keyword.
+    
+    Spelling out the parameters avoids building an args tuple and kwargs dict
+    on every call. Parameters are forwarded by keyword, so this only applies
+    when there are no positional-only or variadic parameters.
+    
+    Args:
+        params: The parameters of the generated function
+        target: Expression for the callable to forward to, evaluated in namespace
+        namespace: Globals for the generated function
+        
+    Returns:
+        Optional[Callable]: The generated function, or None if params can't be
+            forwarded by keyword
+    """
+    signature_parts = []
+    keyword_only = False
+    namespace = dict(namespace)
+    for index, param in enumerate(params):
+        if param.kind not in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):
+            return None
+        if param.kind is inspect.Parameter.KEYWORD_ONLY and not keyword_only:
+            signature_parts.append("*")
+            keyword_only = True
+        if param.default is inspect.Parameter.empty:
+            signature_parts.append(param.name)
+        else:
+            namespace[f"_default_{index}"] = param.default
+            signature_parts.append(f"{param.name}=_default_{index}")
+    arguments = ", ".join(f"{param.name}={param.name}" for param in params)
+    source = f"def class_tool_wrapper({', '.join(signature_parts)}):\n    return {target}({arguments})\n"
+    exec(source, namespace)
+    return namespace["class_tool_wrapper"]
+
+
+def make_class_tool(cls: type) -> Callable:
+    """
+    Create a tool function that instantiates a tool class and calls its run method.
+    
+    Args:
+        cls: The tool class (a BaseTool subclass decorated with @tool)
+        
+    Returns:
+        Callable: A wrapper with the signature of run (without 'self') and the
+            class name, docstring and tool attributes
+    """
+    # Get the run method signature (without 'self') and type hints; the
+    # signature is computed by @tool when the class is decorated
+    run_method = getattr(cls, 'run')
+    new_sig = vars(cls).get('_tool_signature')
+    if new_sig is None:
+        run_sig = inspect.signature(run_method)
+        new_sig = run_sig.replace(parameters=list(run_sig.parameters.values())[1:])
+    run_type_hints = resolve_type_hints(run_method)
+    
+    # Create a wrapper with the same signature as the run method
+    # but without the 'self' parameter
+    params = list(new_sig.parameters.values())
+    
+    if cls.__init__ is BaseTool.__init__ or cls.__init__ is object.__init__:
+        # Stateless tool: create a single instance and reuse it for every call
+        run = cls.get_instance().run
+        class_tool_wrapper = _compile_wrapper(params, "_run", {"_run": run})
+        if class_tool_wrapper is None:
+            def class_tool_wrapper(*args, **kwargs):
+                return run(*args, **kwargs)
+    else:
+        class_tool_wrapper = _compile_wrapper(params, "_cls().run", {"_cls": cls})
+        if class_tool_wrapper is None:
+            def class_tool_wrapper(*args, **kwargs):
+                instance = cls()
+                return instance.run(*args, **kwargs)
+    
+    # Set the correct signature and metadata
+    class_tool_wrapper.__signature__ = new_sig
+    class_tool_wrapper.__name__ = cls.__name__
+    class_tool_wrapper.__doc__ = cls.__doc__
+    class_tool_wrapper._is_tool = True
+    class_tool_wrapper._tool_permissions = cls._tool_permissions
+    class_tool_wrapper._tool_pure = cls._tool_pure
+    
+    # Preserve type hints (excluding 'self')
+    class_tool_wrapper.__annotations__ = {
+        k: v for k, v in run_type_hints.items() if k != 'self'
+    }
+    
+    return class_tool_wrapper
 
 
 def discover_toolsets(toolset_names: List[str]) -> Dict[str, Callable]:
@@ -32,64 +145,36 @@ def discover_toolsets(toolset_names: List[str]) -> Dict[str, Callable]:
         if not os.path.exists(toolset_path):
             continue
             
-        # Look for Python files in the toolset directory (excluding __init__.py)
-        for filename in os.listdir(toolset_path):
-            if filename.endswith('.py') and filename != '__init__.py':
-                module_name = filename[:-3]  # Remove .py extension
-                try:
-                    # Import the module
-                    full_module_name = f'janito.tools.{toolset_name}.{module_name}'
-                    module = importlib.import_module(full_module_name)
-                    
-                    # Get all attributes that are classes defined in this module
-                    for attr_name in dir(module):
-                        if attr_name.startswith('_'):
-                            continue
-                            
-                        attr = getattr(module, attr_name)
-                        if not isinstance(attr, type):
-                            continue
-                            
-                        # Check if the class is actually defined in this module
-                        # (not imported from elsewhere)
-                        if hasattr(attr, '__module__') and attr.__module__ == full_module_name:
-                            # Check if the class is explicitly marked as a tool
-                            if is_tool(attr):
-                                # Create a wrapper function that instantiates and calls run
-                                def make_class_tool(cls):
-                                    # Get the run method signature and type hints
-                                    run_method = getattr(cls, 'run')
-                                    run_sig = inspect.signature(run_method)
-                                    run_type_hints = get_type_hints(run_method)
-                                    
-                                    # Create a wrapper with the same signature as the run method
-                                    # but without the 'self' parameter
-                                    params = list(run_sig.parameters.values())[1:]  # Skip 'self'
-                                    new_sig = run_sig.replace(parameters=params)
-                                    
-                                    def class_tool_wrapper(*args, **kwargs):
-                                        instance = cls()
-                                        return instance.run(*args, **kwargs)
-                                    
-                                    # Set the correct signature and metadata
-                                    class_tool_wrapper.__signature__ = new_sig
-                                    class_tool_wrapper.__name__ = cls.__name__
-                                    class_tool_wrapper.__doc__ = cls.__doc__
-                                    class_tool_wrapper._is_tool = True
-                                    class_tool_wrapper._tool_permissions = getattr(cls, '_tool_permissions', "")
-                                    
-                                    # Preserve type hints (excluding 'self')
-                                    class_tool_wrapper.__annotations__ = {
-                                        k: v for k, v in run_type_hints.items() if k != 'self'
-                                    }
-                                    
-                                    return class_tool_wrapper
-                                
-                                tools[attr_name] = make_class_tool(attr)
-                                    
-                except Exception as e:
-                    # Silently skip modules that can't be imported
-                    # In a real system, you might want to log this
+        # Look for Python modules in the toolset directory
+        for module_info in pkgutil.iter_modules([toolset_path]):
+            if module_info.ispkg:
+                continue
+            try:
+                # Import the module
+                full_module_name = f'janito.tools.{toolset_name}.{module_info.name}'
+                module = importlib.import_module(full_module_name)
+                
+                # Tool classes registered by the @tool decorator
+                registered = vars(module).get('__tools__')
+                if registered is not None:
+                    for cls in registered:
+                        tools[cls.__name__] = make_class_tool(cls)
                     continue
+                
+                # Otherwise, classes defined in this module (not imported from
+                # elsewhere) that are explicitly marked as tools
+                for attr_name, attr in vars(module).items():
+                    if (
+                        isinstance(attr, type)
+                        and attr.__module__ == full_module_name
+                        and is_tool(attr)
+                        and not attr_name.startswith('_')
+                    ):
+                        tools[attr_name] = make_class_tool(attr)
+                        
+            except Exception as e:
+                # Silently skip modules that can't be imported
+                # In a real system, you might want to log this
+                continue
     
     return tools
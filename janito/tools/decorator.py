@@ -5,11 +5,14 @@ This module provides a decorator that can be used to explicitly mark
 functions as tools that should be included in the auto-discovery process.
 """
 
-from typing import Callable, Any, Optional, Type, Union
-import functools
+from typing import Callable, Optional, Type, Union
+import inspect
+import sys
 
+from ..tooling.base_tool import _get_start_prefix
 
-def tool(obj: Optional[Union[Callable, Type]] = None, *, permissions: str = "") -> Union[Callable, Type]:
+
+def tool(obj: Optional[Union[Callable, Type]] = None, *, permissions: str = "", pure: bool = False) -> Union[Callable, Type]:
     """
     Decorator to explicitly mark a function or class as an AI tool.
     
@@ -24,6 +27,9 @@ def tool(obj: Optional[Union[Callable, Type]] = None, *, permissions: str = "")
         - The class must implement a `run` method
         - An instance is created and the `run` method is called
         - Permissions are stored on the class
+        - The class is appended to its module's __tools__ list, which tool
+          discovery reads instead of scanning the module
+        - The signature of `run` (without 'self') is stored as _tool_signature
         
     Args:
         obj (Callable or Type, optional): The function or class to mark as a tool
@@ -32,31 +38,39 @@ def tool(obj: Optional[Union[Callable, Type]] = None, *, permissions: str = "")
             - "w": write access (create, modify, delete files/directories)
             - "x": execute access (run commands, scripts, programs)
             - Combinations like "rw", "rx", "rwx" are allowed
+        pure (bool): Whether the tool's result depends only on its arguments and
+            local state it does not modify (e.g. reading files). Results of pure
+            tools may be reused for identical calls within a single prompt.
+            Tools that write, execute or use the network must leave this False.
             
     Returns:
-        Callable or Type: The original function/class with _is_tool and _tool_permissions attributes set
+        Callable or Type: The original function/class with _is_tool, _tool_permissions
+            and _tool_pure attributes set
     """
     def decorator(obj: Union[Callable, Type]) -> Union[Callable, Type]:
         # Mark the object as a tool
         obj._is_tool = True  # type: ignore
+        obj._tool_pure = pure  # type: ignore
         
         if isinstance(obj, type):
             # It's a class
             obj._tool_permissions = permissions  # type: ignore
+            # Resolve the report prefix once for the class
+            obj._tool_start_prefix = _get_start_prefix(permissions)  # type: ignore
+            # Introspect run once here instead of when the tool is loaded
+            run_sig = inspect.signature(obj.run)
+            obj._tool_signature = run_sig.replace(  # type: ignore
+                parameters=list(run_sig.parameters.values())[1:]  # Skip 'self'
+            )
+            
+            # Register the class in its module's __tools__ list so discovery
+            # doesn't have to scan the module namespace
+            module = sys.modules.get(obj.__module__)
+            if module is not None:
+                vars(module).setdefault("__tools__", []).append(obj)
         else:
-            # It's a function
+            # It's a function: mark it directly; no wrapper is needed
             obj._tool_permissions = permissions  # type: ignore
-            
-            # Preserve the original function's metadata
-            @functools.wraps(obj)
-            def wrapper(*args: Any, **kwargs: Any) -> Any:
-                return obj(*args, **kwargs)
-            
-            # Also mark the wrapper as a tool and set permissions
-            wrapper._is_tool = True  # type: ignore
-            wrapper._tool_permissions = permissions  # type: ignore
-            
-            return wrapper
         
         return obj
     
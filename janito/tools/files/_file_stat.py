@@ -0,0 +1,27 @@
+"""
+Stat helper shared by the file tools.
+
+A tool that needs to know whether a path exists, what it is and its size makes
+one stat call with stat_or_none instead of separate os.path.exists, isfile and
+getsize calls (one stat each).
+"""
+
+import os
+from typing import Optional
+
+
+def stat_or_none(path: str) -> Optional[os.stat_result]:
+    """
+    Stat a path, following symlinks like os.path.exists does.
+    
+    Args:
+        path (str): The path to stat
+        
+    Returns:
+        os.stat_result or None: The stat result, or None where os.path.exists
+            would return False (missing path, broken symlink, no permission)
+    """
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
@@ -13,7 +13,7 @@ For AI function calling, use through the tool registry (tooling.tools_registry).
 import os
 import json
 from typing import Dict, Any, Optional
-from ...tooling import BaseTool, norm_path
+from ...tooling import BaseTool, norm_path, to_abs_path
 from ..decorator import tool
 
 
@@ -40,91 +40,71 @@ class CreateDirectory(BaseTool):
                 - 'created': bool indicating if directory was actually created (vs already existed)
                 - 'error': error message if operation failed (only present if success=False)
         """
-        try:
-            abs_directory = os.path.abspath(directory)
-            norm_path_str = norm_path(abs_directory)
-            
-            # Report start
-            self.report_start(f"Creating directory {norm_path_str}", end="")
-            
-            # Check if directory already exists
-            if os.path.exists(abs_directory):
-                if exist_ok:
-                    self.report_result(f"Directory already exists: {norm_path_str}")
-                    return {
-                        "success": True,
-                        "directory": directory,
-                        "message": f"Directory already exists: {norm_path_str}",
-                        "created": False,
-                        "parents": parents,
-                        "exist_ok": exist_ok
-                    }
-                else:
-                    self.report_error(f"Directory already exists: {norm_path_str} (use exist_ok=True to ignore)")
+        # Quick operation: write its messages together
+        with self.report_batch():
+            try:
+                abs_directory = to_abs_path(directory)
+                norm_path_str = norm_path(abs_directory)
+                
+                # Report start
+                self.report_start(f"Creating directory {norm_path_str}", end="")
+                
+                # Create the directory; existing paths are only examined if
+                # creation fails, so the common case is a single syscall
+                try:
+                    if parents:
+                        os.makedirs(abs_directory)
+                        self.report_progress(" (with parents)", end="")
+                    else:
+                        os.mkdir(abs_directory)
+                except FileExistsError:
+                    if not os.path.isdir(abs_directory):
+                        error = f"Path is a file, not a directory: {norm_path_str}"
+                        self.report_error(error)
+                        return {
+                            "success": False,
+                            "error": error,
+                            "directory": directory,
+                            "parents": parents,
+                            "exist_ok": exist_ok
+                        }
+                    if exist_ok:
+                        self.report_result(f"Directory already exists: {norm_path_str}")
+                        return {
+                            "success": True,
+                            "directory": directory,
+                            "message": f"Directory already exists: {norm_path_str}",
+                            "created": False,
+                            "parents": parents,
+                            "exist_ok": exist_ok
+                        }
+                    error = f"Directory already exists: {norm_path_str} (use exist_ok=True to ignore)"
+                    self.report_error(error)
                     return {
                         "success": False,
-                        "error": f"Directory already exists: {norm_path_str} (use exist_ok=True to ignore)",
+                        "error": error,
                         "directory": directory,
                         "parents": parents,
                         "exist_ok": exist_ok
                     }
-            
-            # Check if path is a file
-            if os.path.isfile(abs_directory):
-                self.report_error(f"Path is a file, not a directory: {norm_path_str}")
+                
+                self.report_result(f"Successfully created directory")
+                
                 return {
-                    "success": False,
-                    "error": f"Path is a file, not a directory: {norm_path_str}",
+                    "success": True,
                     "directory": directory,
+                    "message": f"Successfully created directory {norm_path_str}",
+                    "created": True,
                     "parents": parents,
                     "exist_ok": exist_ok
                 }
-            
-            # Create the directory
-            if parents:
-                os.makedirs(abs_directory, exist_ok=exist_ok)
-                self.report_progress(" (with parents)", end="")
-            else:
-                os.mkdir(abs_directory)
-            
-            self.report_result(f"Successfully created directory")
-            
-            return {
-                "success": True,
-                "directory": directory,
-                "message": f"Successfully created directory {norm_path_str}",
-                "created": True,
-                "parents": parents,
-                "exist_ok": exist_ok
-            }
-            
-        except PermissionError as e:
-            self.report_error(f"Permission denied: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Permission denied: {str(e)}",
-                "directory": directory,
-                "parents": parents,
-                "exist_ok": exist_ok
-            }
-        except OSError as e:
-            self.report_error(f"OS Error creating directory: {str(e)}")
-            return {
-                "success": False,
-                "error": f"OS Error creating directory: {str(e)}",
-                "directory": directory,
-                "parents": parents,
-                "exist_ok": exist_ok
-            }
-        except Exception as e:
-            self.report_error(f"Error creating directory: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "directory": directory,
-                "parents": parents,
-                "exist_ok": exist_ok
-            }
+                
+            except PermissionError as e:
+                return self._error_result("Permission denied", e, directory=directory, parents=parents, exist_ok=exist_ok)
+            except OSError as e:
+                return self._error_result("OS Error creating directory", e, directory=directory, parents=parents, exist_ok=exist_ok)
+            except Exception as e:
+                return self._error_result("Error creating directory", e, directory=directory, parents=parents, exist_ok=exist_ok)
 
 
 # CLI interface for testing
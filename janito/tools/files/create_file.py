@@ -12,7 +12,7 @@ For AI function calling, use through the tool registry (tooling.tools_registry).
 import os
 import json
 from typing import Dict, Any, Optional
-from ...tooling import BaseTool, norm_path
+from ...tooling import BaseTool, norm_path, to_abs_path
 from ..decorator import tool
 
 
@@ -39,52 +39,60 @@ class CreateFile(BaseTool):
                 - 'lines_written': number of lines written
                 - 'error': error message if operation failed (only present if success=False)
         """
-        try:
-            abs_filepath = os.path.abspath(filepath)
-            norm_path_str = norm_path(abs_filepath)
-            
-            # Report start
-            self.report_start(f"Creating file {norm_path_str}", end="")
-            
-            # Check if file exists and overwrite is not allowed
-            if os.path.exists(abs_filepath) and not overwrite:
-                self.report_error("File already exists; (use overwrite=True to replace)")
+        # Quick operation: write its messages together
+        with self.report_batch():
+            try:
+                abs_filepath = to_abs_path(filepath)
+                norm_path_str = norm_path(abs_filepath)
+                
+                # Report start
+                self.report_start(f"Creating file {norm_path_str}", end="")
+                
+                # Encode once; the encoded bytes are both written and measured
+                if os.linesep != '\n':
+                    content = content.replace('\n', os.linesep)
+                encoded = content.encode('utf-8')
+                
+                # Exclusive creation fails atomically if the file already exists
+                mode = 'wb' if overwrite else 'xb'
+                try:
+                    f = open(abs_filepath, mode)
+                except FileExistsError:
+                    self.report_error("File already exists; (use overwrite=True to replace)")
+                    return {
+                        "success": False,
+                        "error": f"File already exists: {norm_path_str} (use overwrite=True to replace)",
+                        "filepath": filepath
+                    }
+                except FileNotFoundError:
+                    # Create parent directories if they don't exist
+                    # (exist_ok makes a separate existence check unnecessary)
+                    parent_dir = os.path.dirname(abs_filepath)
+                    if not parent_dir:
+                        raise
+                    os.makedirs(parent_dir, exist_ok=True)
+                    f = open(abs_filepath, mode)
+                    self.report_progress(f" (created directories)", end="")
+                
+                # Write the content to the file
+                with f:
+                    f.write(encoded)
+                bytes_written = len(encoded)
+                # An unterminated last line counts; a trailing newline does not add one
+                lines_written = encoded.count(b'\n') + (encoded[-1:] not in (b'', b'\n'))
+                
+                self.report_result(f"Wrote {bytes_written} bytes ({lines_written} lines)")
+                
                 return {
-                    "success": False,
-                    "error": f"File already exists: {norm_path_str} (use overwrite=True to replace)",
-                    "filepath": filepath
+                    "success": True,
+                    "filepath": filepath,
+                    "bytes_written": bytes_written,
+                    "lines_written": lines_written,
+                    "overwrite": overwrite
                 }
-            
-            # Create parent directories if they don't exist
-            parent_dir = os.path.dirname(abs_filepath)
-            if parent_dir and not os.path.exists(parent_dir):
-                os.makedirs(parent_dir, exist_ok=True)
-                self.report_progress(f" (created directories)", end="")
-            
-            # Write the content to the file
-            with open(abs_filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-                bytes_written = len(content.encode('utf-8'))
-                lines_written = content.count('\n') + (1 if content else 0) if content else 0
-            
-            self.report_result(f"Wrote {bytes_written} bytes ({lines_written} lines)")
-            
-            return {
-                "success": True,
-                "filepath": filepath,
-                "bytes_written": bytes_written,
-                "lines_written": lines_written,
-                "overwrite": overwrite
-            }
-            
-        except Exception as e:
-            self.report_error(f"Error creating file: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "filepath": filepath,
-                "overwrite": overwrite
-            }
+                
+            except Exception as e:
+                return self._error_result("Error creating file", e, filepath=filepath, overwrite=overwrite)
 
 
 # CLI interface for testing
@@ -10,10 +10,12 @@ For direct execution, use: python -m janito.tools.files.delete_file [args]
 For AI function calling, use through the tool registry (tooling.tools_registry).
 """
 
+import errno
 import os
 import json
+import stat
 from typing import Dict, Any, Optional
-from ...tooling import BaseTool, norm_path
+from ...tooling import BaseTool, norm_path, to_abs_path
 from ..decorator import tool
 
 
@@ -38,80 +40,74 @@ class DeleteFile(BaseTool):
                 - 'message': success message with details
                 - 'error': error message if operation failed (only present if success=False)
         """
-        try:
-            abs_filepath = os.path.abspath(filepath)
-            norm_path_str = norm_path(abs_filepath)
-            
-            # Report start
-            self.report_start(f"Deleting file {norm_path_str}", end="")
-            
-            if not os.path.exists(abs_filepath):
-                self.report_error(f"File does not exist: {norm_path_str}")
+        # Quick operation: write its messages together
+        with self.report_batch():
+            try:
+                abs_filepath = to_abs_path(filepath)
+                norm_path_str = norm_path(abs_filepath)
+                
+                # Report start
+                self.report_start(f"Deleting file {norm_path_str}", end="")
+                
+                # A single lstat call tells whether the path exists, what it is and its size;
+                # it does not follow symlinks, so broken links are still found and removed
+                try:
+                    st = os.lstat(abs_filepath)
+                except (FileNotFoundError, NotADirectoryError):
+                    error = f"File does not exist: {norm_path_str}"
+                    self.report_error(error)
+                    return {
+                        "success": False,
+                        "error": error,
+                        "filepath": filepath
+                    }
+                is_link = stat.S_ISLNK(st.st_mode)
+                is_file = is_link or stat.S_ISREG(st.st_mode)
+                
+                if not force and not is_file:
+                    error = f"Path is not a file: {norm_path_str} (use force=True to delete directories)"
+                    self.report_error(error)
+                    return {
+                        "success": False,
+                        "error": error,
+                        "filepath": filepath
+                    }
+                
+                # Report what is being deleted and delete it with one call;
+                # the size comes from the lstat above
+                if is_file:
+                    self.report_progress(" (symlink)" if is_link else f" ({st.st_size} bytes)", end="")
+                    os.remove(abs_filepath)
+                    message = f"Successfully deleted file {norm_path_str}"
+                else:
+                    # This would be a directory if force=True
+                    self.report_progress(" (directory)", end="")
+                    os.rmdir(abs_filepath)
+                    message = f"Successfully deleted directory {norm_path_str}"
+                
+                self.report_result(message)
+                
                 return {
-                    "success": False,
-                    "error": f"File does not exist: {norm_path_str}",
-                    "filepath": filepath
-                }
-            
-            if not force and not os.path.isfile(abs_filepath):
-                self.report_error(f"Path is not a file: {norm_path_str} (use force=True to delete directories)")
-                return {
-                    "success": False,
-                    "error": f"Path is not a file: {norm_path_str} (use force=True to delete directories)",
-                    "filepath": filepath
-                }
-            
-            # Get file size for information
-            if os.path.isfile(abs_filepath):
-                file_size = os.path.getsize(abs_filepath)
-                size_str = f"({file_size} bytes)"
-                self.report_progress(f" {size_str}", end="")
-            else:
-                self.report_progress(" (directory)", end="")
-            
-            # Perform deletion
-            if os.path.isfile(abs_filepath):
-                os.remove(abs_filepath)
-                message = f"Successfully deleted file {norm_path_str}"
-            else:
-                # This would be a directory if force=True
-                os.rmdir(abs_filepath)
-                message = f"Successfully deleted directory {norm_path_str}"
-            
-            self.report_result(message)
-            
-            return {
-                "success": True,
-                "filepath": filepath,
-                "message": message,
-                "force": force
-            }
-            
-        except OSError as e:
-            if e.errno == 39:  # Directory not empty
-                self.report_error(f"Cannot delete non-empty directory: {norm_path_str} (use force=True with caution)")
-                return {
-                    "success": False,
-                    "error": f"Cannot delete non-empty directory: {norm_path_str} (use force=True with caution)",
-                    "filepath": filepath,
-                    "force": force
-                }
-            else:
-                self.report_error(f"OS Error deleting file: {str(e)}")
-                return {
-                    "success": False,
-                    "error": str(e),
+                    "success": True,
                     "filepath": filepath,
+                    "message": message,
                     "force": force
                 }
-        except Exception as e:
-            self.report_error(f"Error deleting file: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "filepath": filepath,
-                "force": force
-            }
+                
+            except OSError as e:
+                if e.errno == errno.ENOTEMPTY:  # Directory not empty
+                    error = f"Cannot delete non-empty directory: {norm_path_str} (use force=True with caution)"
+                    self.report_error(error)
+                    return {
+                        "success": False,
+                        "error": error,
+                        "filepath": filepath,
+                        "force": force
+                    }
+                else:
+                    return self._error_result("OS Error deleting file", e, filepath=filepath, force=force)
+            except Exception as e:
+                return self._error_result("Error deleting file", e, filepath=filepath, force=force)
 
 
 # CLI interface for testing
@@ -12,27 +12,165 @@ For AI function calling, use through the tool registry (tooling.tools_registry).
 
 import os
 import json
-from typing import Dict, Any, List, Optional
+import stat
+from typing import Callable, Dict, Any, List, Optional
 from ...tooling import BaseTool, norm_path
 from ..decorator import tool
+from ._file_stat import stat_or_none
 
 
-def _matches_pattern(filename: str, pattern: str) -> bool:
+def _pattern_matcher(pattern: str) -> Callable[[str], Any]:
     """
-    Check if filename matches the given pattern using Unix shell-style wildcards.
+    Compile a shell-style pattern once into a match function for many filenames.
+    
+    Matches the same names as fnmatch.fnmatch, without its per-call
+    pattern cache lookup and case normalization on case-sensitive systems.
+    Literal names and "*<suffix>" patterns (e.g. "Makefile", "*.py") are
+    matched with plain string comparisons; the regex for a leading "*" has to
+    backtrack from the end of every name, while an anchored literal prefix
+    already fails fast in the regex.
     
     Args:
-        filename (str): The filename to check
         pattern (str): The pattern to match against (e.g., "*.py", "data_??.csv")
     
     Returns:
-        bool: True if filename matches pattern, False otherwise
+        Callable[[str], Any]: A function returning a truthy value for matching filenames
+    """
+    pattern = os.path.normcase(pattern)
+    literal = pattern.lstrip("*")
+    if "*" in literal or "?" in literal or "[" in literal:
+        import fnmatch
+        import re
+        match = re.compile(fnmatch.translate(pattern)).match
+    elif literal == pattern:
+        match = pattern.__eq__
+    else:
+        match = lambda filename: filename.endswith(literal)
+    if os.path.normcase("A") == "A":
+        return match
+    return lambda filename: match(os.path.normcase(filename))
+
+
+def _scan_tree(abs_directory: str, max_depth: Optional[int]):
+    """
+    Walk a directory tree with os.scandir, like os.walk without followlinks.
+    
+    Entries are classified from their cached DirEntry data, so no extra stat
+    is made per file. Symlinks to directories are reported as directories but
+    not descended into, and unreadable directories are skipped.
+    
+    Args:
+        abs_directory (str): The absolute path of the top directory
+        max_depth (int, optional): Deepest level whose entries are listed
+            (0 lists only the top directory); None for unlimited
+    
+    Yields:
+        tuple: (name, path relative to abs_directory, is_dir) for each entry
     """
-    import fnmatch
-    return fnmatch.fnmatch(filename, pattern)
+    stack = [(abs_directory, "", 0)]
+    while stack:
+        path, rel_dir, depth = stack.pop()
+        descend = max_depth is None or depth < max_depth
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    rel_path = rel_dir + name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    yield name, rel_path, is_dir
+                    if is_dir and descend and not entry.is_symlink():
+                        stack.append((entry.path, rel_path + os.sep, depth + 1))
+        except OSError:
+            continue
 
 
-@tool(permissions="r")
+def _scan_tree_parallel(abs_directory: str, max_depth: Optional[int]):
+    """
+    Walk a directory tree like _scan_tree, reading directories on a thread pool.
+    
+    Useful on high-latency filesystems (network shares, cluster filesystems)
+    where each directory read waits on a round trip; the reads then overlap.
+    Entries are yielded in no particular order. Closing the generator early
+    stops the workers.
+    
+    Args:
+        abs_directory (str): The absolute path of the top directory
+        max_depth (int, optional): Deepest level whose entries are listed
+            (0 lists only the top directory); None for unlimited
+    
+    Yields:
+        tuple: (name, path relative to abs_directory, is_dir) for each entry
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    import queue
+    import threading
+    
+    # Each scanned directory puts one (entries, is last) batch; pending counts
+    # the directories submitted but not yet finished
+    results = queue.Queue()
+    stop = threading.Event()
+    lock = threading.Lock()
+    pending = 1
+    executor = ThreadPoolExecutor(thread_name_prefix="list_files")
+    
+    def submit(path, rel_dir, depth):
+        nonlocal pending
+        with lock:
+            pending += 1
+        try:
+            executor.submit(scan, path, rel_dir, depth)
+        except RuntimeError:
+            # The pool was shut down by the consumer
+            with lock:
+                pending -= 1
+    
+    def scan(path, rel_dir, depth):
+        nonlocal pending
+        batch = []
+        descend = max_depth is None or depth < max_depth
+        try:
+            if stop.is_set():
+                # The consumer is gone; don't read directories still queued
+                return
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if stop.is_set():
+                        break
+                    name = entry.name
+                    rel_path = rel_dir + name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    batch.append((name, rel_path, is_dir))
+                    if is_dir and descend and not entry.is_symlink():
+                        submit(entry.path, rel_path + os.sep, depth + 1)
+        except OSError:
+            # Unreadable directory
+            pass
+        finally:
+            # Subdirectories were counted before this one finishes, so pending
+            # only reaches zero on the last directory; putting under the lock
+            # keeps that batch last in the queue
+            with lock:
+                pending -= 1
+                results.put((batch, pending == 0))
+    
+    try:
+        executor.submit(scan, abs_directory, "", 0)
+        last = False
+        while not last:
+            batch, last = results.get()
+            yield from batch
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
+
+
+@tool(permissions="r", pure=True)
 class ListFiles(BaseTool):
     """
     Tool for listing files and directories in the specified path.
@@ -43,7 +181,10 @@ class ListFiles(BaseTool):
         directory: str = ".",
         pattern: Optional[str] = None,
         recursive: bool = False,
-        max_depth: Optional[int] = None
+        max_depth: Optional[int] = None,
+        limit: Optional[int] = None,
+        parallel: bool = False,
+        sort: bool = True
     ) -> Dict[str, Any]:
         """
         List files and directories in the specified path.
@@ -53,6 +194,9 @@ class ListFiles(BaseTool):
             pattern (str, optional): File pattern to filter results (e.g., "*.py", "data_*.csv").
             recursive (bool): Whether to list files recursively. Default is False.
             max_depth (int, optional): Maximum depth for recursive listing. Default is None (unlimited).
+            limit (int, optional): Stop after this many matching items. Default is None (unlimited).
+            parallel (bool): Read directories concurrently during recursive listing; faster on network filesystems. Default is False.
+            sort (bool): Whether to sort the results by path. Default is True; False keeps directory order, which is cheaper for large listings.
         
         Returns:
             Dict[str, Any]: A dictionary containing:
@@ -61,6 +205,7 @@ class ListFiles(BaseTool):
                 - 'directory': the directory that was listed
                 - 'pattern': the pattern used for filtering (if any)
                 - 'recursive': whether recursive listing was used
+                - 'truncated': whether the listing stopped early because of limit
                 - 'error': error message if operation failed (only present if success=False)
         """
         try:
@@ -69,7 +214,8 @@ class ListFiles(BaseTool):
             
             norm_dir = norm_path(abs_directory)
             
-            if not os.path.exists(abs_directory):
+            st = stat_or_none(abs_directory)
+            if st is None:
                 self.report_error(f"Directory does not exist: {norm_dir}")
                 return {
                     "success": False,
@@ -79,7 +225,7 @@ class ListFiles(BaseTool):
                     "recursive": recursive
                 }
             
-            if not os.path.isdir(abs_directory):
+            if not stat.S_ISDIR(st.st_mode):
                 self.report_error(f"Path is not a directory: {norm_dir}")
                 return {
                     "success": False,
@@ -94,51 +240,46 @@ class ListFiles(BaseTool):
             self.report_start(f"Listing files at {norm_dir} {recursive_str}", end="")
             
             files = []
+            match = _pattern_matcher(pattern) if pattern is not None else None
             dir_count = 0
             file_count = 0
+            truncated = False
             
             if recursive:
-                if max_depth is None:
-                    for root, dirs, filenames in os.walk(abs_directory):
-                        dir_count += len(dirs)
-                        file_count += len(filenames)
-                        for name in dirs + filenames:
-                            full_path = os.path.join(root, name)
-                            rel_path = os.path.relpath(full_path, abs_directory)
-                            if pattern is None or _matches_pattern(name, pattern):
-                                files.append(rel_path if rel_path != "." else name)
-                else:
-                    # Walk with depth limit
-                    for root, dirs, filenames in os.walk(abs_directory):
-                        depth = root[len(abs_directory):].count(os.sep)
-                        if depth <= max_depth:
-                            dir_count += len(dirs)
-                            file_count += len(filenames)
-                            for name in dirs + filenames:
-                                full_path = os.path.join(root, name)
-                                rel_path = os.path.relpath(full_path, abs_directory)
-                                if pattern is None or _matches_pattern(name, pattern):
-                                    files.append(rel_path if rel_path != "." else name)
-                        else:
-                            dirs[:] = []  # Don't recurse further
-            else:
-                # Non-recursive listing
-                items = os.listdir(abs_directory)
-                for item in items:
-                    item_path = os.path.join(abs_directory, item)
-                    if os.path.isdir(item_path):
+                scan_tree = _scan_tree_parallel if parallel else _scan_tree
+                for name, rel_path, is_dir in scan_tree(abs_directory, max_depth):
+                    if match is None or match(name):
+                        if limit is not None and len(files) >= limit:
+                            # Stop the walk; the remaining entries are never read
+                            truncated = True
+                            break
+                        files.append(rel_path)
+                    if is_dir:
                         dir_count += 1
                     else:
                         file_count += 1
-                    if pattern is None or _matches_pattern(item, pattern):
-                        files.append(item)
+            else:
+                # Non-recursive listing
+                with os.scandir(abs_directory) as entries:
+                    for entry in entries:
+                        if match is None or match(entry.name):
+                            if limit is not None and len(files) >= limit:
+                                truncated = True
+                                break
+                            files.append(entry.name)
+                        if entry.is_dir():
+                            dir_count += 1
+                        else:
+                            file_count += 1
             
             # Sort files for consistent output
-            files.sort()
+            if sort:
+                files.sort()
             
             # Report results
             total_found = len(files)
-            self.report_result(f"Found {total_found} items ({file_count} files, {dir_count} dirs)")
+            truncated_str = f" (stopped at limit {limit})" if truncated else ""
+            self.report_result(f"Found {total_found} items ({file_count} files, {dir_count} dirs){truncated_str}")
             
             return {
                 "success": True,
@@ -147,6 +288,7 @@ class ListFiles(BaseTool):
                 "pattern": pattern,
                 "recursive": recursive,
                 "max_depth": max_depth,
+                "truncated": truncated,
                 "stats": {
                     "total_items": total_found,
                     "files": file_count,
@@ -176,6 +318,9 @@ def main():
     parser.add_argument("--pattern", "-p", help="File pattern to filter results (e.g., '*.py')")
     parser.add_argument("--recursive", "-r", action="store_true", help="List files recursively")
     parser.add_argument("--max-depth", "-d", type=int, help="Maximum depth for recursive listing")
+    parser.add_argument("--limit", "-l", type=int, help="Stop after this many matching items")
+    parser.add_argument("--parallel", action="store_true", help="Read directories concurrently when listing recursively")
+    parser.add_argument("--no-sort", dest="sort", action="store_false", help="Keep directory order instead of sorting the results")
     parser.add_argument("--json", "-j", action="store_true", help="Output in JSON format")
     
     args = parser.parse_args()
@@ -185,7 +330,10 @@ def main():
         directory=args.directory,
         pattern=args.pattern,
         recursive=args.recursive,
-        max_depth=args.max_depth
+        max_depth=args.max_depth,
+        limit=args.limit,
+        parallel=args.parallel,
+        sort=args.sort
     )
     
     if args.json:
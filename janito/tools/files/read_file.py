@@ -11,12 +11,15 @@ For AI function calling, use through the tool registry (tooling.tools_registry).
 
 import os
 import json
+import stat
+from itertools import islice
 from typing import Dict, Any, Optional
 from ...tooling import BaseTool, norm_path
 from ..decorator import tool
+from ._file_stat import stat_or_none
 
 
-@tool(permissions="r")
+@tool(permissions="r", pure=True)
 class ReadFile(BaseTool):
     """
     Tool for reading the contents of a file.
@@ -45,7 +48,8 @@ class ReadFile(BaseTool):
             # Report start
             self.report_start(f"📖 Reading file {norm_path_str}", end="")
             
-            if not os.path.exists(abs_filepath):
+            st = stat_or_none(abs_filepath)
+            if st is None:
                 self.report_error(f"File does not exist: {norm_path_str}")
                 return {
                     "success": False,
@@ -53,7 +57,7 @@ class ReadFile(BaseTool):
                     "filepath": filepath
                 }
             
-            if not os.path.isfile(abs_filepath):
+            if not stat.S_ISREG(st.st_mode):
                 self.report_error(f"Path is not a file: {norm_path_str}")
                 return {
                     "success": False,
@@ -62,22 +66,21 @@ class ReadFile(BaseTool):
                 }
             
             # Get file size for progress indication
-            file_size = os.path.getsize(abs_filepath)
+            file_size = st.st_size
             size_str = f"({file_size} bytes)"
             self.report_progress(f" {size_str}", end="")
             
-            with open(abs_filepath, 'r', encoding='utf-8') as f:
-                if max_lines is not None:
-                    lines = []
-                    for i, line in enumerate(f):
-                        if i >= max_lines:
-                            break
-                        lines.append(line.rstrip('\n'))
-                    content = '\n'.join(lines)
-                    lines_read = len(lines)
-                else:
+            if max_lines is not None:
+                # Text iteration is lazy; only the first max_lines lines are read
+                with open(abs_filepath, 'r', encoding='utf-8') as f:
+                    lines = [line.rstrip('\n') for line in islice(f, max(max_lines, 0))]
+                content = '\n'.join(lines)
+                lines_read = len(lines)
+            else:
+                with open(abs_filepath, 'r', encoding='utf-8') as f:
                     content = f.read()
-                    lines_read = content.count('\n') + 1
+                # An unterminated last line counts as a line
+                lines_read = content.count('\n') + (content[-1:] not in ('', '\n'))
             
             self.report_result(f"Read {lines_read} lines")
             
@@ -11,12 +11,105 @@ For AI function calling, use through the tool registry (tooling.tools_registry).
 
 import os
 import json
-from typing import Dict, Any, Optional
+import stat
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from ...tooling import BaseTool, norm_path
 from ..decorator import tool
+from ._file_stat import stat_or_none
 
 
-@tool(permissions="r")
+# Size of the blocks newlines are counted in
+_BLOCK_SIZE = 1 << 16
+
+# Line indexes of recently read large files, keyed by path and stat identity
+# (device, inode, mtime, size) so a modified file is indexed again
+_LINE_INDEX_CACHE: "OrderedDict[tuple, Tuple[array, int]]" = OrderedDict()
+_LINE_INDEX_CACHE_SIZE = 64
+# Smaller files are cheap enough to read whole every time
+_LINE_INDEX_MIN_SIZE = 1 << 20
+
+
+def _line_start(data: bytes, count: int, pos: int = 0) -> int:
+    """
+    Find the byte offset of the line `count` lines after offset pos.
+    
+    Newlines are counted a block at a time with bytes.count, and located one
+    by one with bytes.find only inside the block holding the target line.
+    
+    Args:
+        data (bytes): The file contents with "\n" line endings
+        count (int): Number of lines to skip
+        pos (int): Offset of a line start to count from (default: 0)
+    
+    Returns:
+        int: Offset where the line starts, or len(data) if there are fewer lines
+    """
+    block = _BLOCK_SIZE
+    size = len(data)
+    while count > 0:
+        end = pos + block
+        newlines = data.count(b"\n", pos, end)
+        if newlines < count and end < size:
+            count -= newlines
+            pos = end
+            continue
+        for _ in range(count):
+            newline = data.find(b"\n", pos)
+            if newline == -1:
+                return size
+            pos = newline + 1
+        return pos
+    return pos
+
+
+def _build_line_index(data: bytes) -> array:
+    """
+    Count the newlines before each block of a file.
+    
+    Args:
+        data (bytes): The file contents with "\n" line endings
+    
+    Returns:
+        array: Entry i is the number of newlines before block i; the last
+            entry is the number of newlines in the file
+    """
+    index = array('q', [0])
+    newlines = 0
+    for pos in range(0, len(data), _BLOCK_SIZE):
+        newlines += data.count(b"\n", pos, pos + _BLOCK_SIZE)
+        index.append(newlines)
+    return index
+
+
+def _read_indexed_lines(abs_filepath: str, index: array, first: int, stop: int) -> bytes:
+    """
+    Read lines first..stop-1 (0-based) of an indexed file without reading the rest.
+    
+    Args:
+        abs_filepath (str): The file to read
+        index (array): The file's index from _build_line_index
+        first (int): Index of the first line to read
+        stop (int): Index of the line after the last one to read
+    
+    Returns:
+        bytes: The raw bytes of the lines
+    """
+    # Line k starts after the k-th newline, which lies in the last block
+    # with fewer than k newlines before it
+    first_block = max(bisect_left(index, first) - 1, 0)
+    stop_block = max(bisect_left(index, stop) - 1, first_block)
+    with open(abs_filepath, 'rb') as f:
+        f.seek(first_block * _BLOCK_SIZE)
+        data = f.read((stop_block + 1 - first_block) * _BLOCK_SIZE)
+    start = _line_start(data, first - index[first_block])
+    end = _line_start(data, stop - first, start)
+    return data[start:end]
+
+
+@tool(permissions="r", pure=True)
 class ReadFileLines(BaseTool):
     """
     Tool for reading specific line ranges from a file (1-based indexing).
@@ -57,7 +150,8 @@ class ReadFileLines(BaseTool):
                 
             self.report_start(f"Reading file {norm_path_str}{range_info}", end="")
             
-            if not os.path.exists(abs_filepath):
+            st = stat_or_none(abs_filepath)
+            if st is None:
                 self.report_error(f"File does not exist: {norm_path_str}")
                 return {
                     "success": False,
@@ -65,7 +159,7 @@ class ReadFileLines(BaseTool):
                     "filepath": filepath
                 }
             
-            if not os.path.isfile(abs_filepath):
+            if not stat.S_ISREG(st.st_mode):
                 self.report_error(f"Path is not a file: {norm_path_str}")
                 return {
                     "success": False,
@@ -74,15 +168,37 @@ class ReadFileLines(BaseTool):
                 }
             
             # Get file size for progress indication
-            file_size = os.path.getsize(abs_filepath)
+            file_size = st.st_size
             size_str = f"({file_size} bytes)"
             self.report_progress(f" {size_str}", end="")
             
-            # Read the file and determine total lines
-            with open(abs_filepath, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-            
-            total_lines = len(all_lines)
+            # A large file read before has a line index; only the blocks holding
+            # the requested lines are read then
+            index_key = (abs_filepath, st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+            cached = _LINE_INDEX_CACHE.get(index_key)
+            if cached is not None:
+                _LINE_INDEX_CACHE.move_to_end(index_key)
+                line_index, total_lines = cached
+                data = None
+            else:
+                # Read the raw bytes; lines are located with byte scans and only the
+                # requested range is decoded, instead of building a string per line
+                with open(abs_filepath, 'rb') as f:
+                    data = f.read()
+                has_cr = b'\r' in data
+                if has_cr:
+                    # Translate line endings as text mode's universal newlines would
+                    data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                
+                # An unterminated last line counts as a line
+                total_lines = data.count(b'\n') + (data[-1:] not in (b'', b'\n'))
+                
+                # Offsets in the index are file offsets, so files whose line
+                # endings were translated are not indexed
+                if not has_cr and len(data) >= _LINE_INDEX_MIN_SIZE:
+                    _LINE_INDEX_CACHE[index_key] = (_build_line_index(data), total_lines)
+                    if len(_LINE_INDEX_CACHE) > _LINE_INDEX_CACHE_SIZE:
+                        _LINE_INDEX_CACHE.popitem(last=False)
             
             # Validate line numbers
             if from_line is not None and (from_line < 1 or from_line > total_lines):
@@ -121,9 +237,13 @@ class ReadFileLines(BaseTool):
                 }
             
             # Extract the requested lines
-            selected_lines = all_lines[actual_from:actual_to]
-            content = ''.join(selected_lines)
-            lines_read = len(selected_lines)
+            if data is None:
+                content = _read_indexed_lines(abs_filepath, line_index, actual_from, actual_to).decode('utf-8')
+            else:
+                start = _line_start(data, actual_from)
+                end = _line_start(data, actual_to - actual_from, start)
+                content = data[start:end].decode('utf-8')
+            lines_read = actual_to - actual_from
             
             # Determine actual line range read
             actual_from_line = actual_from + 1  # Convert back to 1-based
@@ -12,12 +12,83 @@ For AI function calling, use through the tool registry (tooling.tools_registry).
 
 import os
 import json
-from typing import Dict, Any, List, Optional
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from ...tooling import BaseTool, norm_path
 from ..decorator import tool
+from ._file_stat import stat_or_none
 
 
-@tool(permissions="r")
+def _read_one(filepath: str, max_lines: Optional[int]) -> Tuple[str, int, Dict[str, Any]]:
+    """
+    Read a single file for ReadMultipleFiles.
+    
+    Does no reporting, so it can run on worker threads.
+    
+    Args:
+        filepath (str): The file path as given by the caller
+        max_lines (int, optional): Maximum number of lines to read
+    
+    Returns:
+        Tuple[str, int, Dict[str, Any]]: The normalized path for progress
+            messages, the file size (0 if unknown) and the per-file result
+    """
+    norm_path_str = filepath
+    file_size = 0
+    try:
+        abs_filepath = os.path.abspath(filepath)
+        norm_path_str = norm_path(abs_filepath)
+        
+        st = stat_or_none(abs_filepath)
+        if st is None:
+            return norm_path_str, file_size, {
+                "filepath": filepath,
+                "success": False,
+                "error": f"File does not exist: {norm_path_str}"
+            }
+        
+        if not stat.S_ISREG(st.st_mode):
+            return norm_path_str, file_size, {
+                "filepath": filepath,
+                "success": False,
+                "error": f"Path is not a file: {norm_path_str}"
+            }
+        
+        # Get file size for progress indication
+        file_size = st.st_size
+        
+        with open(abs_filepath, 'r', encoding='utf-8') as f:
+            if max_lines is not None:
+                lines = []
+                for j, line in enumerate(f):
+                    if j >= max_lines:
+                        break
+                    lines.append(line.rstrip('\n'))
+                content = '\n'.join(lines)
+                lines_read = len(lines)
+            else:
+                content = f.read()
+                # An unterminated last line counts as a line
+                lines_read = content.count('\n') + (content[-1:] not in ('', '\n'))
+        
+        return norm_path_str, file_size, {
+            "filepath": filepath,
+            "success": True,
+            "content": content,
+            "lines_read": lines_read,
+            "max_lines": max_lines
+        }
+        
+    except Exception as e:
+        return norm_path_str, file_size, {
+            "filepath": filepath,
+            "success": False,
+            "error": str(e)
+        }
+
+
+@tool(permissions="r", pure=True)
 class ReadMultipleFiles(BaseTool):
     """
     Tool for reading the contents of multiple files.
@@ -49,8 +120,13 @@ class ReadMultipleFiles(BaseTool):
                 "files": []
             }
         
-        # Normalize the list (strip whitespace from each path)
-        filepath_list = [path.strip() for path in filepaths if path and path.strip()]
+        # A bare string is a single path, not a sequence of one-character paths
+        if isinstance(filepaths, str):
+            filepaths = [filepaths]
+        
+        # Normalize the list (strip whitespace from each path, drop repeated
+        # paths keeping the first occurrence)
+        filepath_list = list(dict.fromkeys(path.strip() for path in filepaths if path and path.strip()))
         
         if not filepath_list:
             self.report_error("No valid file paths provided")
@@ -68,72 +144,33 @@ class ReadMultipleFiles(BaseTool):
             
             results = []
             successful_count = 0
+            total = len(filepath_list)
             
-            for i, filepath in enumerate(filepath_list):
-                try:
-                    abs_filepath = os.path.abspath(filepath)
-                    norm_path_str = norm_path(abs_filepath)
-                    
+            # Read the files concurrently so their I/O overlaps; map returns
+            # them in order, so progress is still reported file by file
+            if total > 1:
+                executor = ThreadPoolExecutor(max_workers=min(32, total))
+                read_results = executor.map(_read_one, filepath_list, [max_lines] * total)
+            else:
+                executor = None
+                read_results = map(_read_one, filepath_list, [max_lines])
+            
+            try:
+                for i, (norm_path_str, file_size, result) in enumerate(read_results):
                     # Show progress for each file
-                    if len(filepath_list) > 1:
-                        self.report_progress(f"\n  [{i+1}/{len(filepath_list)}] {norm_path_str}", end="")
+                    if total > 1:
+                        self.report_progress(f"\n  [{i+1}/{total}] {norm_path_str}", end="")
                     else:
                         self.report_progress(f" {norm_path_str}", end="")
-                    
-                    if not os.path.exists(abs_filepath):
-                        error_result = {
-                            "filepath": filepath,
-                            "success": False,
-                            "error": f"File does not exist: {norm_path_str}"
-                        }
-                        results.append(error_result)
-                        continue
-                    
-                    if not os.path.isfile(abs_filepath):
-                        error_result = {
-                            "filepath": filepath,
-                            "success": False,
-                            "error": f"Path is not a file: {norm_path_str}"
-                        }
-                        results.append(error_result)
-                        continue
-                    
-                    # Get file size for progress indication
-                    file_size = os.path.getsize(abs_filepath)
                     if file_size > 0:
-                        size_str = f"({file_size} bytes)"
-                        self.report_progress(f" {size_str}", end="")
-                    
-                    with open(abs_filepath, 'r', encoding='utf-8') as f:
-                        if max_lines is not None:
-                            lines = []
-                            for j, line in enumerate(f):
-                                if j >= max_lines:
-                                    break
-                                lines.append(line.rstrip('\n'))
-                            content = '\n'.join(lines)
-                            lines_read = len(lines)
-                        else:
-                            content = f.read()
-                            lines_read = content.count('\n') + 1
-                    
-                    success_result = {
-                        "filepath": filepath,
-                        "success": True,
-                        "content": content,
-                        "lines_read": lines_read,
-                        "max_lines": max_lines
-                    }
-                    results.append(success_result)
-                    successful_count += 1
+                        self.report_progress(f" ({file_size} bytes)", end="")
                     
-                except Exception as e:
-                    error_result = {
-                        "filepath": filepath,
-                        "success": False,
-                        "error": str(e)
-                    }
-                    results.append(error_result)
+                    results.append(result)
+                    if result["success"]:
+                        successful_count += 1
+            finally:
+                if executor is not None:
+                    executor.shutdown()
             
             # Report final results
             total_files = len(filepath_list)
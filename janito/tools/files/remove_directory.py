@@ -10,12 +10,283 @@ For direct execution, use: python -m janito.tools.files.remove_directory [args]
 For AI function calling, use through the tool registry (tooling.tools_registry).
 """
 
+import errno
 import os
-import shutil
 import json
-from typing import Dict, Any, Optional
+import stat
+from typing import Dict, Any, List, Optional
 from ...tooling import BaseTool, norm_path
 from ..decorator import tool
+from ._file_stat import stat_or_none
+
+
+# Directories can be read and emptied through descriptors (POSIX): names are
+# then resolved relative to an open directory instead of from the root
+_DIR_FD_SUPPORTED = (
+    {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd
+    and os.scandir in os.supports_fd
+)
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_NOFOLLOW", 0)
+
+
+def _is_reparse_point(st: os.stat_result) -> bool:
+    """
+    Tell whether a Windows stat result is a reparse point, such as a junction.
+    
+    Junctions are not symlinks to is_dir(follow_symlinks=False), but like
+    shutil.rmtree they must be removed as links, never descended into:
+    their contents belong to the target, outside the tree.
+    
+    Args:
+        st (os.stat_result): A stat result taken without following symlinks
+    
+    Returns:
+        bool: True for a reparse point (always False outside Windows)
+    """
+    return bool(getattr(st, "st_file_attributes", 0) & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _check_not_link(path: str) -> None:
+    """
+    Refuse to remove a tree through a symlink or junction, like shutil.rmtree.
+    
+    Args:
+        path (str): The top directory to remove
+    
+    Raises:
+        OSError: If path is a symlink or a Windows junction
+    """
+    if os.path.islink(path) or (os.name == "nt" and _is_reparse_point(os.lstat(path))):
+        raise OSError("Cannot call rmtree on a symbolic link")
+
+
+def _remove_contents_fd(dir_fd: int, removed: List[int]) -> None:
+    """
+    Remove everything inside an open directory, using *at calls relative to it.
+    
+    Subdirectories are opened without following symlinks, so a directory
+    swapped for a symlink mid-removal makes the open fail instead of
+    leading outside the tree.
+    
+    Args:
+        dir_fd (int): Descriptor of the directory to empty
+        removed (List[int]): One-item counter, incremented for every entry removed
+    """
+    with os.scandir(dir_fd) as scan:
+        entries = list(scan)
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+        if is_dir:
+            fd = os.open(entry.name, _DIR_OPEN_FLAGS, dir_fd=dir_fd)
+            try:
+                _remove_contents_fd(fd, removed)
+            finally:
+                os.close(fd)
+            os.rmdir(entry.name, dir_fd=dir_fd)
+        else:
+            os.unlink(entry.name, dir_fd=dir_fd)
+        removed[0] += 1
+
+
+def _remove_contents(path: str, removed: List[int]) -> None:
+    """
+    Remove everything inside a directory by path, where descriptors can't be used.
+    
+    Windows junctions are removed with os.rmdir, which deletes the junction
+    itself and leaves its target alone.
+    
+    Args:
+        path (str): The directory to empty
+        removed (List[int]): One-item counter, incremented for every entry removed
+    """
+    with os.scandir(path) as scan:
+        entries = list(scan)
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+        if is_dir and os.name == "nt" and _is_reparse_point(entry.stat(follow_symlinks=False)):
+            os.rmdir(entry.path)
+        elif is_dir:
+            _remove_contents(entry.path, removed)
+            os.rmdir(entry.path)
+        else:
+            os.unlink(entry.path)
+        removed[0] += 1
+
+
+def _remove_tree(path: str, removed: List[int]) -> None:
+    """
+    Remove a directory tree, counting the entries removed in the same pass.
+    
+    Works like shutil.rmtree without error handling: symlinks are removed,
+    never followed, and the first error is raised.
+    
+    Args:
+        path (str): The directory to remove
+        removed (List[int]): One-item counter, incremented for every entry
+            removed below path (path itself is not counted); it holds the
+            partial count if an error is raised
+    """
+    _check_not_link(path)
+    if _DIR_FD_SUPPORTED:
+        fd = os.open(path, _DIR_OPEN_FLAGS)
+        try:
+            _remove_contents_fd(fd, removed)
+        finally:
+            os.close(fd)
+    else:
+        _remove_contents(path, removed)
+    os.rmdir(path)
+
+
+def _remove_tree_parallel(path: str, removed: List[int]) -> None:
+    """
+    Remove a directory tree like _remove_tree, removing subdirectories on a thread pool.
+    
+    Sibling directories are independent, so their removals can overlap; this
+    pays off on large trees and on filesystems where each call waits on I/O.
+    Each directory is removed once its last child is gone. Entries that
+    disappear concurrently are ignored.
+    
+    Like _remove_tree, every directory is opened without following symlinks
+    and emptied through its descriptor. Where descriptors can't be used that
+    way (Windows), the tree is removed sequentially with _remove_tree.
+    
+    Args:
+        path (str): The directory to remove
+        removed (List[int]): One-item counter, incremented for every entry
+            removed below path (path itself is not counted); it holds the
+            partial count if an error is raised
+    """
+    if not _DIR_FD_SUPPORTED:
+        return _remove_tree(path, removed)
+    
+    from concurrent.futures import ThreadPoolExecutor
+    import threading
+    
+    _check_not_link(path)
+    
+    # A directory node is [fd, name, parent node, holds]; holds counts its
+    # subdirectories not yet removed, plus one while it is being scanned. A
+    # node's descriptor stays open until its last child is removed, since the
+    # children are opened and removed relative to it. outstanding counts the
+    # directories submitted but not yet scanned.
+    lock = threading.Lock()
+    done = threading.Event()
+    errors = []
+    open_fds = set()
+    outstanding = 1
+    executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                  thread_name_prefix="remove_directory")
+    
+    def release(node):
+        # Drop one hold; the directory that loses its last hold is closed and
+        # removed, which in turn releases its parent. The top directory is
+        # removed by path once all workers are done.
+        while node is not None:
+            with lock:
+                node[3] -= 1
+                if node[3]:
+                    return
+                open_fds.discard(node[0])
+            os.close(node[0])
+            parent = node[2]
+            if parent is None:
+                return
+            os.rmdir(node[1], dir_fd=parent[0])
+            with lock:
+                removed[0] += 1
+            node = parent
+    
+    def scan(parent, name):
+        nonlocal outstanding
+        unlinked = 0
+        try:
+            if errors:
+                return
+            if parent is None:
+                fd = os.open(name, _DIR_OPEN_FLAGS)
+            else:
+                fd = os.open(name, _DIR_OPEN_FLAGS, dir_fd=parent[0])
+            node = [fd, name, parent, 1]
+            with lock:
+                open_fds.add(fd)
+            with os.scandir(fd) as scan_entries:
+                entries = list(scan_entries)
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    with lock:
+                        node[3] += 1
+                        outstanding += 1
+                    executor.submit(scan, node, entry.name)
+                else:
+                    try:
+                        os.unlink(entry.name, dir_fd=fd)
+                        unlinked += 1
+                    except FileNotFoundError:
+                        pass
+            with lock:
+                removed[0] += unlinked
+            unlinked = 0
+            release(node)
+        except Exception as e:
+            # The directory keeps its hold, so none of its ancestors are removed
+            with lock:
+                errors.append(e)
+        finally:
+            with lock:
+                removed[0] += unlinked
+                outstanding -= 1
+                if not outstanding:
+                    done.set()
+    
+    try:
+        executor.submit(scan, None, path)
+        done.wait()
+    finally:
+        executor.shutdown(wait=True)
+        # Directories left behind by an error still have their descriptors open
+        for fd in open_fds:
+            os.close(fd)
+    if errors:
+        raise errors[0]
+    os.rmdir(path)
+
+
+def _remove_tree_rm(path: str, removed: List[Optional[int]]) -> None:
+    """
+    Remove a directory tree like _remove_tree, with a single "rm -rf" process.
+    
+    rm's native loop avoids the interpreter overhead per entry, which matters
+    for very large trees. rm does not report what it removed, so no count is
+    kept. Only used on POSIX; without an rm binary this falls back to
+    _remove_tree, which counts.
+    
+    Args:
+        path (str): The directory to remove
+        removed (List[Optional[int]]): One-item counter; set to None, since
+            the entries removed by rm are not counted
+    """
+    import subprocess
+    
+    _check_not_link(path)
+    try:
+        proc = subprocess.run(["rm", "-rf", "--", path], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        return _remove_tree(path, removed)
+    removed[0] = None
+    if proc.returncode:
+        error = proc.stderr.decode(errors="replace").strip()
+        raise OSError(error or f"rm exited with status {proc.returncode}")
 
 
 @tool(permissions="w")
@@ -24,7 +295,7 @@ class RemoveDirectory(BaseTool):
     Tool for removing a directory from the filesystem.
     """
     
-    def run(self, directory: str, recursive: bool = False, force: bool = False) -> Dict[str, Any]:
+    def run(self, directory: str, recursive: bool = False, force: bool = False, parallel: bool = False) -> Dict[str, Any]:
         """
         Remove a directory from the filesystem.
         
@@ -32,6 +303,7 @@ class RemoveDirectory(BaseTool):
             directory (str): The path to the directory to remove
             recursive (bool): Whether to remove directory and all its contents recursively (default: False)
             force (bool): Whether to ignore errors and continue (default: False)
+            parallel (bool): Remove subdirectories concurrently; faster for large trees (default: False)
         
         Returns:
             Dict[str, Any]: A dictionary containing:
@@ -39,10 +311,14 @@ class RemoveDirectory(BaseTool):
                 - 'directory': the directory that was removed
                 - 'message': success message with details
                 - 'recursive': whether recursive removal was used
-                - 'items_removed': number of items removed (if recursive=True)
+                - 'items_removed': number of items removed (if recursive=True); None when
+                  removed with rm (JANITO_FAST_RM), which does not report a count
                 - 'error': error message if operation failed (only present if success=False)
         """
+        context = {"directory": directory, "recursive": recursive, "force": force}
         try:
+            # Not to_abs_path: the path must be normalized, since a trailing
+            # separator would make a symlink to a directory look like one
             abs_directory = os.path.abspath(directory)
             norm_path_str = norm_path(abs_directory)
             
@@ -50,60 +326,38 @@ class RemoveDirectory(BaseTool):
             recursive_str = "recursively" if recursive else ""
             self.report_start(f"Removing directory {norm_path_str} {recursive_str}", end="")
             
-            if not os.path.exists(abs_directory):
+            st = stat_or_none(abs_directory)
+            if st is None:
                 if force:
-                    self.report_result(f"Directory does not exist (ignored due to force=True): {norm_path_str}")
-                    return {
-                        "success": True,
-                        "directory": directory,
-                        "message": f"Directory does not exist (ignored due to force=True): {norm_path_str}",
-                        "recursive": recursive,
-                        "force": force,
-                        "items_removed": 0
-                    }
+                    message = f"Directory does not exist (ignored due to force=True): {norm_path_str}"
+                    self.report_result(message)
+                    return {"success": True, "message": message, **context, "items_removed": 0}
                 else:
-                    self.report_error(f"Directory does not exist: {norm_path_str}")
-                    return {
-                        "success": False,
-                        "error": f"Directory does not exist: {norm_path_str}",
-                        "directory": directory,
-                        "recursive": recursive,
-                        "force": force
-                    }
+                    return self._failure_result(f"Directory does not exist: {norm_path_str}", **context)
             
-            if not os.path.isdir(abs_directory):
+            if not stat.S_ISDIR(st.st_mode):
                 if force:
-                    self.report_result(f"Path is not a directory (ignored due to force=True): {norm_path_str}")
-                    return {
-                        "success": True,
-                        "directory": directory,
-                        "message": f"Path is not a directory (ignored due to force=True): {norm_path_str}",
-                        "recursive": recursive,
-                        "force": force,
-                        "items_removed": 0
-                    }
+                    message = f"Path is not a directory (ignored due to force=True): {norm_path_str}"
+                    self.report_result(message)
+                    return {"success": True, "message": message, **context, "items_removed": 0}
                 else:
-                    self.report_error(f"Path is not a directory: {norm_path_str}")
-                    return {
-                        "success": False,
-                        "error": f"Path is not a directory: {norm_path_str}",
-                        "directory": directory,
-                        "recursive": recursive,
-                        "force": force
-                    }
+                    return self._failure_result(f"Path is not a directory: {norm_path_str}", **context)
             
-            # Count items if recursive
-            items_removed = 0
+            # Entries are counted while they are removed
+            removed = [0]
+            # An explicit parallel=True takes precedence over JANITO_FAST_RM
+            if parallel:
+                remove_tree = _remove_tree_parallel
+            elif os.name == "posix" and os.environ.get("JANITO_FAST_RM") == "1":
+                remove_tree = _remove_tree_rm
+            else:
+                remove_tree = _remove_tree
             if recursive:
                 try:
-                    # Count items before removal
-                    for root, dirs, files in os.walk(abs_directory):
-                        items_removed += len(dirs) + len(files)
-                    size_str = f"({items_removed} items)"
-                    self.report_progress(f" {size_str}", end="")
-                    
                     # Remove recursively
-                    shutil.rmtree(abs_directory)
+                    remove_tree(abs_directory, removed)
+                    if removed[0] is not None:
+                        self.report_progress(f" ({removed[0]} items)", end="")
                     message = f"Successfully removed directory recursively {norm_path_str}"
                 except Exception as e:
                     if force:
@@ -118,67 +372,32 @@ class RemoveDirectory(BaseTool):
                     os.rmdir(abs_directory)
                     message = f"Successfully removed empty directory {norm_path_str}"
                 except OSError as e:
-                    if e.errno == 39:  # Directory not empty
+                    # Some systems report a non-empty directory as EEXIST
+                    if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
                         if force:
                             self.report_warning(f"Directory not empty, attempting recursive removal (force mode)")
-                            # Count items before removal
-                            for root, dirs, files in os.walk(abs_directory):
-                                items_removed += len(dirs) + len(files)
-                            size_str = f"({items_removed} items)"
-                            self.report_progress(f" {size_str}", end="")
-                            shutil.rmtree(abs_directory)
+                            remove_tree(abs_directory, removed)
+                            if removed[0] is not None:
+                                self.report_progress(f" ({removed[0]} items)", end="")
                             message = f"Successfully removed directory recursively {norm_path_str} (force mode)"
                         else:
-                            self.report_error(f"Directory not empty: {norm_path_str} (use recursive=True to remove non-empty directories)")
-                            return {
-                                "success": False,
-                                "error": f"Directory not empty: {norm_path_str} (use recursive=True to remove non-empty directories)",
-                                "directory": directory,
-                                "recursive": recursive,
-                                "force": force
-                            }
+                            return self._failure_result(
+                                f"Directory not empty: {norm_path_str} (use recursive=True to remove non-empty directories)",
+                                **context
+                            )
                     else:
                         raise e
             
             self.report_result(message)
             
-            return {
-                "success": True,
-                "directory": directory,
-                "message": message,
-                "recursive": recursive,
-                "force": force,
-                "items_removed": items_removed
-            }
+            return {"success": True, "message": message, **context, "items_removed": removed[0]}
             
         except PermissionError as e:
-            self.report_error(f"Permission denied: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Permission denied: {str(e)}",
-                "directory": directory,
-                "recursive": recursive,
-                "force": force
-            }
+            return self._error_result("Permission denied", e, **context)
         except OSError as e:
-            self.report_error(f"OS Error removing directory: {str(e)}")
-            return {
-                "success": False,
-                "error": f"OS Error removing directory: {str(e)}",
-                "directory": directory,
-                "recursive": recursive,
-                "force": force
-            }
+            return self._error_result("OS Error removing directory", e, **context)
         except Exception as e:
-            self.report_error(f"Error removing directory: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "directory": directory,
-                "recursive": recursive,
-                "force": force
-            }
-
+            return self._error_result("Error removing directory", e, **context)
 
 # CLI interface for testing
 def main():
@@ -189,6 +408,7 @@ def main():
     parser.add_argument("directory", help="Directory path to remove")
     parser.add_argument("--recursive", "-r", action="store_true", help="Remove directory and all contents recursively")
     parser.add_argument("--force", "-f", action="store_true", help="Force removal, ignore errors")
+    parser.add_argument("--parallel", action="store_true", help="Remove subdirectories concurrently")
     parser.add_argument("--json", "-j", action="store_true", help="Output in JSON format")
     
     args = parser.parse_args()
@@ -197,7 +417,8 @@ def main():
     result = tool_instance.run(
         directory=args.directory,
         recursive=args.recursive,
-        force=args.force
+        force=args.force,
+        parallel=args.parallel
     )
     
     if args.json:
@@ -11,9 +11,193 @@ For AI function calling, use through the tool registry (tooling.tools_registry).
 
 import os
 import json
-from typing import Dict, Any
-from ...tooling import BaseTool, norm_path
+import mmap
+import stat
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+from ...tooling import BaseTool, norm_path, to_abs_path
 from ..decorator import tool
+from ._file_stat import stat_or_none
+
+
+# Files at least this large are replaced through a memory mapping
+_MAP_MIN_SIZE = 16 << 20
+
+# Bytes copied per write when rewriting a mapped file
+_COPY_BLOCK_SIZE = 1 << 20
+
+
+def _count_mapped(mapped: mmap.mmap, needle: bytes) -> int:
+    """
+    Count the non-overlapping occurrences of needle in a mapped file.
+    
+    Args:
+        mapped (mmap.mmap): The mapped file (mmap has no count method)
+        needle (bytes): The non-empty bytes to count
+    
+    Returns:
+        int: The number of occurrences
+    """
+    count = 0
+    pos = mapped.find(needle)
+    while pos >= 0:
+        count += 1
+        pos = mapped.find(needle, pos + len(needle))
+    return count
+
+
+def _mapped_replacement_blocks(
+    mapped: mmap.mmap,
+    old_bytes: bytes,
+    new_bytes: bytes,
+    first: int,
+    replace_all: bool
+) -> Iterator[bytes]:
+    """
+    Generate the contents of a mapped file with old_bytes replaced, block by block.
+    
+    The unchanged stretches are copied in blocks of at most _COPY_BLOCK_SIZE,
+    so memory use does not grow with the file size. "\n" is written as
+    os.linesep, as text mode would.
+    
+    Args:
+        mapped (mmap.mmap): The mapped original file
+        old_bytes (bytes): The bytes to replace
+        new_bytes (bytes): The replacement bytes
+        first (int): The position of the first occurrence
+        replace_all (bool): Whether to replace every occurrence or only the first
+    
+    Yields:
+        bytes: The next block of the new contents
+    """
+    linesep = os.linesep.encode()
+    if linesep != b'\n':
+        new_bytes = new_bytes.replace(b'\n', linesep)
+    
+    def copy(start, end):
+        for pos in range(start, end, _COPY_BLOCK_SIZE):
+            block = mapped[pos:min(pos + _COPY_BLOCK_SIZE, end)]
+            if linesep != b'\n':
+                block = block.replace(b'\n', linesep)
+            yield block
+    
+    prev = 0
+    pos = first
+    while pos >= 0:
+        yield from copy(prev, pos)
+        yield new_bytes
+        prev = pos + len(old_bytes)
+        pos = mapped.find(old_bytes, prev) if replace_all else -1
+    yield from copy(prev, len(mapped))
+
+
+def _can_keep_owner(st: os.stat_result) -> bool:
+    """
+    Tell whether a new file can be given the owner and group of an existing one.
+    
+    Args:
+        st (os.stat_result): The stat result of the existing file
+    
+    Returns:
+        bool: True if chown to its owner and group is permitted
+    """
+    if not hasattr(os, "chown"):
+        # No POSIX ownership to preserve (Windows)
+        return True
+    euid = os.geteuid()
+    if euid == 0:
+        return True
+    return st.st_uid == euid and (st.st_gid == os.getegid() or st.st_gid in os.getgroups())
+
+
+def _has_xattrs(path: str) -> bool:
+    """
+    Tell whether a file has extended attributes.
+    
+    ACLs and SELinux labels are stored as extended attributes on Linux, so
+    this also covers them.
+    
+    Args:
+        path (str): The path of the file
+    
+    Returns:
+        bool: True if the file has extended attributes (False where they
+            can't be listed)
+    """
+    if not hasattr(os, "listxattr"):
+        return False
+    try:
+        return bool(os.listxattr(path))
+    except OSError:
+        return False
+
+
+def _create_replacement_file(abs_filepath: str, st: os.stat_result) -> Optional[Tuple[int, str]]:
+    """
+    Create an empty temporary file beside a file, to take over its contents.
+    
+    The temporary file gets the original's owner, group and permissions.
+    
+    Args:
+        abs_filepath (str): The absolute path of the original file (not a symlink)
+        st (os.stat_result): The stat result of the original file
+    
+    Returns:
+        Tuple[int, str]: The open descriptor and path of the temporary file, or
+            None if it can't be created or given the original's owner (such as
+            in a directory that is not writable)
+    """
+    import tempfile
+    
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(abs_filepath),
+            prefix=os.path.basename(abs_filepath) + ".",
+            suffix=".tmp"
+        )
+    except OSError:
+        return None
+    try:
+        # chown first: it can clear setuid/setgid bits set by chmod
+        if hasattr(os, "chown"):
+            os.chown(tmp_path, st.st_uid, st.st_gid)
+        os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+    except BaseException as e:
+        os.close(fd)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        if isinstance(e, OSError):
+            return None
+        raise
+    return fd, tmp_path
+
+
+def _write_replacement_file(fd: int, tmp_path: str, blocks: Iterable[bytes]) -> None:
+    """
+    Write new contents to a temporary file from _create_replacement_file.
+    
+    The data is synced to disk, so moving the file over the original with
+    os.replace swaps the contents atomically: an interruption leaves either
+    version, never a mix. The temporary file is removed if writing fails.
+    
+    Args:
+        fd (int): The open descriptor of the temporary file (closed on return)
+        tmp_path (str): The path of the temporary file
+        blocks (Iterable[bytes]): The new contents
+    """
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            for block in blocks:
+                out.write(block)
+            out.flush()
+            os.fsync(out.fileno())
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 @tool(permissions="rw")
@@ -47,110 +231,166 @@ class ReplaceTextInFile(BaseTool):
                 - 'replacements': number of replacements made (only if replace_all=True)
                 - 'error': error message if operation failed (only present if success=False)
         """
+        context = {"filepath": filepath, "old_str": old_str, "new_str": new_str}
         try:
-            abs_filepath = os.path.abspath(filepath)
+            abs_filepath = to_abs_path(filepath)
             norm_path_str = norm_path(abs_filepath)
             
             # Report start
             self.report_start(f"Replacing text in file {norm_path_str}", end="")
             
-            if not os.path.exists(abs_filepath):
-                self.report_error(f"File does not exist: {norm_path_str}")
-                return {
-                    "success": False,
-                    "error": f"File does not exist: {norm_path_str}",
-                    "filepath": filepath,
-                    "old_str": old_str,
-                    "new_str": new_str
-                }
+            if not old_str:
+                return self._failure_result("Search text is empty", **context)
             
-            if not os.path.isfile(abs_filepath):
-                self.report_error(f"Path is not a file: {norm_path_str}")
-                return {
-                    "success": False,
-                    "error": f"Path is not a file: {norm_path_str}",
-                    "filepath": filepath,
-                    "old_str": old_str,
-                    "new_str": new_str
-                }
+            st = stat_or_none(abs_filepath)
+            if st is None:
+                return self._failure_result(f"File does not exist: {norm_path_str}", **context)
+            
+            if not stat.S_ISREG(st.st_mode):
+                return self._failure_result(f"Path is not a file: {norm_path_str}", **context)
             
             # Get file size for progress indication
-            file_size = os.path.getsize(abs_filepath)
+            file_size = st.st_size
             size_str = f"({file_size} bytes)"
             self.report_progress(f" {size_str}", end="")
             
-            # Read the file content
-            with open(abs_filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Count occurrences of old_str
-            occurrences = content.count(old_str)
-            
-            if occurrences == 0:
-                error_msg = f"Warning: Search text '{old_str}' not found in file"
-                self.report_error(error_msg)
-                return {
-                    "success": False,
-                    "error": error_msg,
-                    "filepath": filepath,
-                    "old_str": old_str,
-                    "new_str": new_str,
-                    "occurrences": 0
-                }
-            
-            if occurrences > 1 and not replace_all:
-                error_msg = f"Error: Multiple occurrences ({occurrences}) of '{old_str}' found. The search text needs to be unique in the file. Set replace_all=True to replace all occurrences."
-                self.report_error(error_msg)
-                return {
-                    "success": False,
-                    "error": error_msg,
-                    "filepath": filepath,
-                    "old_str": old_str,
-                    "new_str": new_str,
-                    "occurrences": occurrences
-                }
-            
-            # Perform the replacement
-            if replace_all:
-                new_content = content.replace(old_str, new_str)  # Replace all occurrences
-                replacements = occurrences
-                success_msg = f"Text replaced successfully ({replacements} replacement{'s' if replacements > 1 else ''})"
-                result_dict = {
-                    "success": True,
-                    "filepath": filepath,
-                    "old_str": old_str,
-                    "new_str": new_str,
-                    "occurrences": occurrences,
-                    "replacements": replacements
-                }
-            else:
-                new_content = content.replace(old_str, new_str, 1)  # Replace only first occurrence
-                success_msg = f"Text replaced successfully"
-                result_dict = {
-                    "success": True,
-                    "filepath": filepath,
-                    "old_str": old_str,
-                    "new_str": new_str,
-                    "occurrences": occurrences
-                }
+            # Work on the UTF-8 bytes: a UTF-8 needle only matches at character
+            # boundaries, so searching bytes finds the same occurrences as
+            # searching the decoded text, without decoding and re-encoding
+            old_bytes = old_str.encode('utf-8')
+            new_bytes = new_str.encode('utf-8')
             
-            # Write the modified content back to the file
-            with open(abs_filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            # Small files are read and rewritten in place through one open
+            # file. Large files are searched through a read-only mapping and
+            # replaced atomically with a temporary file, so they are never
+            # held in memory or left half-written. Swapping in a new file
+            # would break hard links and drop extended attributes (ACLs,
+            # SELinux labels), and can't always keep the owner, so such
+            # files are always rewritten in place.
+            # Read and write the file a symlink points to, whichever path is
+            # taken: replacing the path itself would swap out the link rather
+            # than edit its target. Messages keep showing the given path.
+            real_filepath = os.path.realpath(abs_filepath)
+            in_place = (
+                file_size < _MAP_MIN_SIZE
+                or st.st_nlink > 1
+                or not _can_keep_owner(st)
+                or _has_xattrs(real_filepath)
+            )
+            content = None
+            f = None
+            mapped = None
+            try:
+                if 0 < file_size < len(old_bytes):
+                    # Too short to contain the search text, so there is nothing to
+                    # read (special files that report size 0 are still read)
+                    content = b''
+                else:
+                    f = open(real_filepath, 'r+b' if in_place else 'rb')
+                    if not in_place:
+                        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                        if mapped.find(b'\r') >= 0:
+                            # Line endings need normalizing; use the in-memory path
+                            mapped.close()
+                            mapped = None
+                    if mapped is None:
+                        content = f.read()
+                        # Match line endings like text mode: "\r\n" and "\r" read as "\n"
+                        if b'\r' in content:
+                            content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                
+                source = content if mapped is None else mapped
+                
+                # Find the first two occurrences; a unique match needs no full count
+                first = source.find(old_bytes)
+                if first < 0:
+                    occurrences = 0
+                elif replace_all or source.find(old_bytes, first + len(old_bytes)) >= 0:
+                    occurrences = content.count(old_bytes) if mapped is None else _count_mapped(mapped, old_bytes)
+                else:
+                    occurrences = 1
+                
+                if occurrences == 0:
+                    return self._failure_result(
+                        f"Warning: Search text '{old_str}' not found in file",
+                        **context,
+                        occurrences=0
+                    )
+                
+                if occurrences > 1 and not replace_all:
+                    return self._failure_result(
+                        f"Error: Multiple occurrences ({occurrences}) of '{old_str}' found. The search text needs to be unique in the file. Set replace_all=True to replace all occurrences.",
+                        **context,
+                        occurrences=occurrences
+                    )
+                
+                if replace_all:
+                    replacements = occurrences
+                    success_msg = f"Text replaced successfully ({replacements} replacement{'s' if replacements > 1 else ''})"
+                    result_dict = {"success": True, **context, "occurrences": occurrences, "replacements": replacements}
+                else:
+                    success_msg = f"Text replaced successfully"
+                    result_dict = {"success": True, **context, "occurrences": occurrences}
+                
+                if old_bytes == new_bytes:
+                    # The file would come out unchanged; don't rewrite it
+                    self.report_result(success_msg)
+                    return result_dict
+                
+                if mapped is not None:
+                    blocks = _mapped_replacement_blocks(mapped, old_bytes, new_bytes, first, replace_all)
+                else:
+                    # Perform the replacement
+                    if replace_all:
+                        new_content = content.replace(old_bytes, new_bytes)  # Replace all occurrences
+                    else:
+                        # Splice the single occurrence in at the position already found
+                        new_content = content[:first] + new_bytes + content[first + len(old_bytes):]
+                    # Release the original before writing to keep peak memory down
+                    content = source = None
+                    
+                    # Use the platform's line endings, as text mode would
+                    if os.linesep != '\n':
+                        new_content = new_content.replace(b'\n', os.linesep.encode())
+                    if in_place:
+                        f.seek(0)
+                        f.write(new_content)
+                        f.truncate()
+                    blocks = (new_content,)
+                
+                if not in_place:
+                    # Write the new contents to a temporary file next to the
+                    # original, then swap it in; Windows can't replace a file
+                    # that is still open or mapped
+                    replacement = _create_replacement_file(real_filepath, st)
+                    if replacement is not None:
+                        _write_replacement_file(*replacement, blocks)
+                    else:
+                        # No temporary file can be made here; rewrite the
+                        # original in place from memory instead
+                        new_content = b''.join(blocks)
+                    if mapped is not None:
+                        mapped.close()
+                        mapped = None
+                    f.close()
+                    if replacement is not None:
+                        os.replace(replacement[1], real_filepath)
+                    else:
+                        with open(real_filepath, 'r+b') as out:
+                            out.write(new_content)
+                            out.truncate()
+            finally:
+                if mapped is not None:
+                    mapped.close()
+                if f is not None:
+                    f.close()
             
             self.report_result(success_msg)
             
             return result_dict
             
         except Exception as e:
-            self.report_error(f"Error replacing text: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "filepath": filepath,
-                "old_str": old_str,
-                "new_str": new_str
-            }
+            return self._error_result("Error replacing text", e, **context)
 
 
 # CLI interface for testing
@@ -17,7 +17,7 @@ from ...tooling import BaseTool, norm_path
 from ..decorator import tool
 
 
-@tool(permissions="r")
+@tool(permissions="r", pure=True)
 class SearchRegex(BaseTool):
     """
     Tool for searching regular expression patterns in files and directories.
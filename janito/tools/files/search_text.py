@@ -16,7 +16,7 @@ from ...tooling import BaseTool, norm_path
 from ..decorator import tool
 
 
-@tool(permissions="r")
+@tool(permissions="r", pure=True)
 class SearchText(BaseTool):
     """
     Tool for searching exact text matches in files and directories.
@@ -7,11 +7,17 @@ and labels. Credentials are securely retrieved from the secrets module.
 """
 
 import imaplib
+import re
 from typing import Dict, Any, List, Optional
 from ...tooling import BaseTool
 from ..decorator import tool
 
 
+# IMAP LIST response parts: quoted strings and the parenthesized flags
+_QUOTED_RE = re.compile(r'"([^"]*)"')
+_FLAGS_RE = re.compile(r'\(([^)]*)\)')
+
+
 @tool(permissions="r")
 class ListFolders(BaseTool):
     """
@@ -185,8 +191,7 @@ class ListFolders(BaseTool):
             # or: (\Flags) "/" "Parent/Child"
             
             # Find all quoted strings - the last one is the folder name
-            import re
-            quotes = re.findall(r'"([^"]*)"', folder_str)
+            quotes = _QUOTED_RE.findall(folder_str)
             if not quotes:
                 return None
             
@@ -194,7 +199,7 @@ class ListFolders(BaseTool):
             folder_name = quotes[-1]
             
             # Parse flags from parentheses
-            flags_match = re.search(r'\(([^)]*)\)', folder_str)
+            flags_match = _FLAGS_RE.search(folder_str)
             flags = []
             if flags_match:
                 flags = [f.strip() for f in flags_match.group(1).split() if f.strip()]
@@ -20,6 +20,9 @@ from .device_code_auth import (
     clear_tokens
 )
 
+# Prefix of parent paths in /users/{userId}/drive/root: form
+_USER_DRIVE_ROOT_RE = re.compile(r"^/users/[^/]+/drive/root:")
+
 
 class OneDriveBaseClient:
     """
@@ -336,7 +339,7 @@ class OneDriveBaseClient:
             parent_path = parent.get("path", "")
             # Handle both /me/drive/root: and /users/{userId}/drive/root: formats
             parent_path = parent_path.replace("/me/drive/root:", "")
-            parent_path = re.sub(r"^/users/[^/]+/drive/root:", "", parent_path)
+            parent_path = _USER_DRIVE_ROOT_RE.sub("", parent_path)
             formatted["parent_path"] = parent_path
             formatted["parent_id"] = parent.get("id")
         
@@ -6,7 +6,6 @@ This tool uses Microsoft Graph API to list files and folders in OneDrive.
 Authentication is done using device code flow.
 """
 
-import re
 from typing import Dict, Any, Optional, List
 from ...tooling import BaseTool
 from ..decorator import tool
@@ -64,7 +63,7 @@ class ListOneDriveFiles(BaseTool):
                 - 'error': error message if operation failed (only present if success=False)
         """
         try:
-            from .base_client import OneDriveBaseClient
+            from .base_client import OneDriveBaseClient, _USER_DRIVE_ROOT_RE
             
             self.report_start(f"Listing files in OneDrive path: {path or 'root'}")
             
@@ -141,7 +140,7 @@ class ListOneDriveFiles(BaseTool):
                     parent_path = item["parentReference"].get("path", "")
                     # Handle both /me/drive/root: and /users/{userId}/drive/root: formats
                     parent_path = parent_path.replace("/me/drive/root:", "")
-                    parent_path = re.sub(r"^/users/[^/]+/drive/root:", "", parent_path)
+                    parent_path = _USER_DRIVE_ROOT_RE.sub("", parent_path)
                     formatted["parent_path"] = parent_path or "/"
                 
                 formatted_items.append(formatted)
@@ -6,7 +6,6 @@ This tool uses Microsoft Graph API to read file metadata from OneDrive.
 For large files or binary content, use DownloadOneDriveFile instead.
 """
 
-import re
 from typing import Dict, Any, Optional
 from ...tooling import BaseTool
 from ..decorator import tool
@@ -59,7 +58,7 @@ class ReadOneDriveFile(BaseTool):
                 - 'error': error message if operation failed (only present if success=False)
         """
         try:
-            from .base_client import OneDriveBaseClient
+            from .base_client import OneDriveBaseClient, _USER_DRIVE_ROOT_RE
             
             self.report_start(f"Reading file: {path}")
             
@@ -101,7 +100,7 @@ class ReadOneDriveFile(BaseTool):
                 parent_path = metadata["parentReference"].get("path", "")
                 # Handle both /me/drive/root: and /users/{userId}/drive/root: formats
                 parent_path = parent_path.replace("/me/drive/root:", "")
-                parent_path = re.sub(r"^/users/[^/]+/drive/root:", "", parent_path)
+                parent_path = _USER_DRIVE_ROOT_RE.sub("", parent_path)
                 file_info["parent_path"] = parent_path or "/"
             
             result = {
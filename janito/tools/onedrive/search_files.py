@@ -5,7 +5,6 @@ Search OneDrive Files Tool - A class-based tool for searching files in OneDrive.
 This tool uses Microsoft Graph API to search for files and folders in OneDrive.
 """
 
-import re
 from typing import Dict, Any, Optional, List
 from ...tooling import BaseTool
 from ..decorator import tool
@@ -52,7 +51,7 @@ class SearchOneDriveFiles(BaseTool):
                 - 'error': error message if operation failed (only present if success=False)
         """
         try:
-            from .base_client import OneDriveBaseClient
+            from .base_client import OneDriveBaseClient, _USER_DRIVE_ROOT_RE
             
             self.report_start(f"Searching OneDrive for: {query}")
             
@@ -145,7 +144,7 @@ class SearchOneDriveFiles(BaseTool):
                     parent_path = item["parentReference"].get("path", "")
                     # Handle both /me/drive/root: and /users/{userId}/drive/root: formats
                     parent_path = parent_path.replace("/me/drive/root:", "")
-                    parent_path = re.sub(r"^/users/[^/]+/drive/root:", "", parent_path)
+                    parent_path = _USER_DRIVE_ROOT_RE.sub("", parent_path)
                     formatted["parent_path"] = parent_path or "/"
                 
                 formatted_items.append(formatted)